@@ -34,6 +34,10 @@ from core.config import config, load_config, load_flask_config
 app = Flask(__name__)
 load_config()
 load_flask_config(app)  # Load config into Flask app.config
+# API responses are read by the frontend, not people: keep insertion order and
+# skip the debug-mode indentation.
+app.json.sort_keys = False
+app.json.compact = True
 
 # Logging setup - MONITOR_LOG imported from app_logging
 monitor_logger = logging.getLogger("monitor_logger")
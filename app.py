@@ -118,6 +118,12 @@ from models.timeline import get_reading_timeline
 # Add URL encoding support for template filters
 from core.file_watcher import FileWatcher
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.events import (
+    EVENT_ALL_JOBS_REMOVED,
+    EVENT_JOB_ADDED,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+)
 
 
 # Custom URL converter for signed integers (supports negative IDs)
@@ -474,15 +480,54 @@ def configure_schedule(schedule_name):
         app_logger.error(f"Failed to configure schedule '{schedule_name}': {e}")
 
 
+# job_id -> (next_run_time, formatted string). Settings pages poll these, but a
+# job's next run only moves when it is rescheduled (listener below) or fires
+# (the cached time is then in the past and gets recomputed).
+_next_run_cache = {}
+_next_run_cache_lock = threading.Lock()
+_next_run_cache_version = 0  # bumped on every reschedule
+
+
+def _invalidate_next_run(event):
+    global _next_run_cache_version
+    job_id = getattr(event, "job_id", None)
+    with _next_run_cache_lock:
+        _next_run_cache_version += 1
+        if job_id is None:
+            _next_run_cache.clear()
+        else:
+            _next_run_cache.pop(job_id, None)
+
+
+app_state.scheduler.add_listener(
+    _invalidate_next_run,
+    EVENT_JOB_ADDED | EVENT_JOB_MODIFIED | EVENT_JOB_REMOVED | EVENT_ALL_JOBS_REMOVED,
+)
+
+
 def get_next_run_for_job(job_id):
     """Get the next scheduled run time for a specific job."""
+    with _next_run_cache_lock:
+        cached = _next_run_cache.get(job_id)
+        version = _next_run_cache_version
+    if cached:
+        next_run_time, formatted = cached
+        if next_run_time is None or next_run_time > datetime.now(next_run_time.tzinfo):
+            return formatted
+
+    next_run_time, formatted = None, "Not scheduled"
     try:
         job = app_state.scheduler.get_job(job_id)
         if job and job.next_run_time:
-            return job.next_run_time.strftime("%Y-%m-%d %H:%M:%S")
+            next_run_time = job.next_run_time
+            formatted = next_run_time.strftime("%Y-%m-%d %H:%M:%S")
     except Exception:
-        pass
-    return "Not scheduled"
+        return formatted
+    with _next_run_cache_lock:
+        # Skip the store if a reschedule raced this lookup.
+        if version == _next_run_cache_version:
+            _next_run_cache[job_id] = (next_run_time, formatted)
+    return formatted
 
 
 # Backward-compatible wrapper
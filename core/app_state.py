@@ -1,6 +1,7 @@
 import time
-import uuid
+import secrets
 import threading
+from collections import deque
 from apscheduler.schedulers.background import BackgroundScheduler
 
 # ── Unified Scheduler ──
@@ -19,8 +20,24 @@ DATA_DIR_STATS_CACHE_DURATION = 300  # 5 minutes
 # ── Operations Registry ──
 _operations = {}
 _operations_lock = threading.Lock()
+# Side indexes so polling doesn't scan every operation: ids still running (for
+# the stale check) and ids in completion order (oldest first, for pruning).
+_running_ops = set()
+_completed_ops = deque()
+# Last get_active_operations() result. Mutators reset it to None; it also
+# lapses at _ops_snapshot_expires, the next time a running op could go stale
+# or a completed one expire.
+_ops_snapshot = None
+_ops_snapshot_expires = 0
 COMPLETED_TTL = 15  # seconds before completed ops are purged
 STALE_TIMEOUT = 300  # seconds with no update before a running op is marked stale/error
+# The stale/expiry checks run on time.monotonic_ns() readings kept beside each
+# operation (id -> [updated_ns, completed_ns]), so wall-clock jumps can't expire
+# or stall an operation early. The started_at/updated_at/completed_at fields
+# handed to the API stay epoch seconds.
+_op_clocks = {}
+COMPLETED_TTL_NS = COMPLETED_TTL * 1_000_000_000
+STALE_TIMEOUT_NS = STALE_TIMEOUT * 1_000_000_000
 
 
 def register_operation(op_type, label, total=0, op_id=None):
@@ -28,33 +45,66 @@ def register_operation(op_type, label, total=0, op_id=None):
 
     Pass ``op_id`` to use a caller-chosen identifier (e.g. a client-generated
     token for synchronous endpoints that want polled progress). Defaults to a
-    fresh uuid when omitted.
+    fresh random hex token when omitted.
     """
+    global _ops_snapshot
     if op_id is None:
-        op_id = uuid.uuid4().hex
+        op_id = secrets.token_hex(16)
     now = time.time()
+    now_ns = time.monotonic_ns()
     with _operations_lock:
-        _operations[op_id] = {
-            "id": op_id,
-            "op_type": op_type,
-            "label": label,
-            "status": "running",
-            "current": 0,
-            "total": total,
-            "detail": "Starting...",
-            "started_at": now,
-            "updated_at": now,
-            "completed_at": None,
-        }
+        _operations[op_id] = _new_operation(op_id, op_type, label, total, now)
+        _op_clocks[op_id] = [now_ns, None]
+        _running_ops.add(op_id)
+        _ops_snapshot = None
     return op_id
 
 
+def register_operations_bulk(specs):
+    """Register several operations under one lock acquisition.
+
+    ``specs`` is an iterable of ``(op_type, label, total)`` tuples. Returns the
+    new operation IDs in the same order.
+    """
+    global _ops_snapshot
+    now = time.time()
+    now_ns = time.monotonic_ns()
+    new_ops = [
+        _new_operation(secrets.token_hex(16), op_type, label, total, now)
+        for op_type, label, total in specs
+    ]
+    with _operations_lock:
+        for op in new_ops:
+            _operations[op["id"]] = op
+            _op_clocks[op["id"]] = [now_ns, None]
+            _running_ops.add(op["id"])
+        _ops_snapshot = None
+    return [op["id"] for op in new_ops]
+
+
+def _new_operation(op_id, op_type, label, total, now):
+    return {
+        "id": op_id,
+        "op_type": op_type,
+        "label": label,
+        "status": "running",
+        "current": 0,
+        "total": total,
+        "detail": "Starting...",
+        "started_at": now,
+        "updated_at": now,
+        "completed_at": None,
+    }
+
+
 def update_operation(op_id, current=None, total=None, detail=None):
     """Update progress on an existing operation. No-op if op_id not found."""
+    global _ops_snapshot
     with _operations_lock:
         op = _operations.get(op_id)
         if op is None:
             return
+        _ops_snapshot = None
         if current is not None:
             op["current"] = current
         if total is not None:
@@ -62,41 +112,111 @@ def update_operation(op_id, current=None, total=None, detail=None):
         if detail is not None:
             op["detail"] = detail
         op["updated_at"] = time.time()
+        _op_clocks[op_id][0] = time.monotonic_ns()
 
 
 def complete_operation(op_id, error=False):
     """Mark an operation as completed or errored."""
+    global _ops_snapshot
     with _operations_lock:
         op = _operations.get(op_id)
         if op is None:
             return
+        _ops_snapshot = None
         op["status"] = "error" if error else "completed"
         op["completed_at"] = time.time()
+        _op_clocks[op_id][1] = time.monotonic_ns()
         if not error:
             op["current"] = op["total"]
+        _running_ops.discard(op_id)
+        _completed_ops.append(op_id)
 
 
 def get_active_operations():
-    """Return all operations, auto-pruning completed/stale ops."""
-    now = time.time()
+    """Return snapshots of all operations, auto-pruning completed/stale ops.
+
+    The returned dicts are copies, so callers can serialize them after the lock
+    is released without racing worker threads that keep updating progress.
+    They are shared between callers until the registry next changes, so treat
+    them as read-only.
+    """
+    global _ops_snapshot, _ops_snapshot_expires
+    now = time.monotonic_ns()
     with _operations_lock:
+        if _ops_snapshot is not None and now < _ops_snapshot_expires:
+            return list(_ops_snapshot)
+
         # Mark stale running ops as error (generator abandoned / connection lost)
-        for op in _operations.values():
-            if op["status"] == "running" and (now - op["updated_at"]) > STALE_TIMEOUT:
-                op["status"] = "error"
-                op["completed_at"] = now
-                op["detail"] = "Operation stalled"
-
-        # Prune expired completed operations
-        expired = [
-            oid for oid, op in _operations.items()
-            if op["status"] in ("completed", "error")
-            and op["completed_at"] is not None
-            and (now - op["completed_at"]) > COMPLETED_TTL
-        ]
-        for oid in expired:
+        for oid in list(_running_ops):
+            op = _operations.get(oid)
+            if op is None or op["status"] != "running":
+                _running_ops.discard(oid)
+                continue
+            if (now - _op_clocks[oid][0]) > STALE_TIMEOUT_NS:
+                _mark_stalled(oid, op, now)
+
+        # Prune expired completed operations. Completion order is oldest first,
+        # so stop at the first one still inside the TTL.
+        while _completed_ops:
+            oid = _completed_ops[0]
+            op = _operations.get(oid)
+            if op is None or op["completed_at"] is None:
+                # Already removed, or re-registered under the same id
+                _completed_ops.popleft()
+                continue
+            if (now - _op_clocks[oid][1]) <= COMPLETED_TTL_NS:
+                break
+            _completed_ops.popleft()
             del _operations[oid]
-        return list(_operations.values())
+            del _op_clocks[oid]
+
+        expires = min(
+            (_op_clocks[oid][0] + STALE_TIMEOUT_NS for oid in _running_ops),
+            default=float("inf"),
+        )
+        if _completed_ops:
+            expires = min(expires, _op_clocks[_completed_ops[0]][1] + COMPLETED_TTL_NS)
+        _ops_snapshot = [op.copy() for op in _operations.values()]
+        _ops_snapshot_expires = expires
+        return list(_ops_snapshot)
+
+
+def get_operation(op_id):
+    """Return a copy of one operation, or None if unknown or expired.
+
+    Applies the same stale/expiry rules as get_active_operations() to just
+    this entry, for pollers that already know their id.
+    """
+    global _ops_snapshot
+    now = time.monotonic_ns()
+    with _operations_lock:
+        op = _operations.get(op_id)
+        if op is None:
+            return None
+        updated_ns, completed_ns = _op_clocks[op_id]
+        if op["status"] == "running" and (now - updated_ns) > STALE_TIMEOUT_NS:
+            _mark_stalled(op_id, op, now)
+            _ops_snapshot = None
+        elif completed_ns is not None and (now - completed_ns) > COMPLETED_TTL_NS:
+            # The completion-order sweep skips ids that are already gone
+            del _operations[op_id]
+            del _op_clocks[op_id]
+            _ops_snapshot = None
+            return None
+        return op.copy()
+
+
+def _mark_stalled(op_id, op, now):
+    """Error out a running op that stopped reporting. Caller holds the lock.
+
+    ``now`` is the caller's ``time.monotonic_ns()`` reading.
+    """
+    op["status"] = "error"
+    op["completed_at"] = time.time()
+    _op_clocks[op_id][1] = now
+    op["detail"] = "Operation stalled"
+    _running_ops.discard(op_id)
+    _completed_ops.append(op_id)
 
 
 # ── Background Notifications ──
@@ -149,6 +149,13 @@ def find_comicinfo_in_zip(zip_ref):
 
     Returns the archive path string or None if not found.
     """
+    # Fast path: the canonical root-level name is an O(1) lookup, so the
+    # common case never builds the full member list.
+    try:
+        return zip_ref.getinfo("ComicInfo.xml").filename
+    except KeyError:
+        pass
+
     namelist = zip_ref.namelist()
     nested_match = None
     for name in namelist:
@@ -1819,6 +1819,9 @@ def add_library(name, path):
         conn.commit()
         conn.close()
 
+        from helpers.library import invalidate_libraries_cache
+        invalidate_libraries_cache()
+
         app_logger.info(f"Added library '{name}' with path {normalized_path}")
         return library_id
     except sqlite3.IntegrityError:
@@ -1877,6 +1880,9 @@ def update_library(library_id, name=None, path=None, enabled=None):
         conn.commit()
         conn.close()
 
+        from helpers.library import invalidate_libraries_cache
+        invalidate_libraries_cache()
+
         app_logger.info(f"Updated library ID {library_id}")
         return True
     except sqlite3.IntegrityError:
@@ -1908,6 +1914,9 @@ def delete_library(library_id):
         conn.commit()
         conn.close()
 
+        from helpers.library import invalidate_libraries_cache
+        invalidate_libraries_cache()
+
         app_logger.info(f"Deleted library ID {library_id}")
         return True
     except Exception as e:
@@ -3680,6 +3689,34 @@ def get_file_index_entry_by_path(path):
 #   Unified Schedules   #
 #########################
 
+# Schedule rows (and the weekly packs history) are polled by the settings pages
+# but only change when a schedule is saved or a job records a run, so keep
+# them in memory.
+_schedule_cache = {}
+_schedule_cache_lock = threading.Lock()
+_schedule_cache_version = 0   # bumped on every invalidation
+
+
+def _schedule_cache_get(key):
+    """Return ``(cached_value_or_None, version)`` for a schedule cache key."""
+    with _schedule_cache_lock:
+        return _schedule_cache.get(key), _schedule_cache_version
+
+
+def _schedule_cache_put(key, value, version):
+    # A write that landed while we were reading makes our row stale; skip it.
+    with _schedule_cache_lock:
+        if version == _schedule_cache_version:
+            _schedule_cache[key] = value
+
+
+def invalidate_schedule_cache():
+    """Drop cached schedule/config rows — call after any write to them."""
+    global _schedule_cache_version
+    with _schedule_cache_lock:
+        _schedule_cache_version += 1
+        _schedule_cache.clear()
+
 
 def get_schedule(name):
     """
@@ -3691,6 +3728,9 @@ def get_schedule(name):
     Returns:
         Dict with frequency, time, weekday, last_run, or None on error
     """
+    cached, version = _schedule_cache_get(("schedule", name))
+    if cached is not None:
+        return dict(cached)
     try:
         conn = get_db_connection()
         if not conn:
@@ -3703,12 +3743,14 @@ def get_schedule(name):
         row = c.fetchone()
         conn.close()
         if row:
-            return {
+            schedule = {
                 "frequency": row["frequency"],
                 "time": row["time"],
                 "weekday": row["weekday"],
                 "last_run": row["last_run"],
             }
+            _schedule_cache_put(("schedule", name), schedule, version)
+            return dict(schedule)
         return None
     except Exception as e:
         app_logger.error(f"Failed to get schedule '{name}': {e}")
@@ -3747,6 +3789,7 @@ def save_schedule(name, frequency, time, weekday=0):
         )
         conn.commit()
         conn.close()
+        invalidate_schedule_cache()
         app_logger.info(f"Saved schedule '{name}': {frequency} at {time}")
         return True
     except Exception as e:
@@ -3774,6 +3817,7 @@ def update_schedule_last_run(name):
         )
         conn.commit()
         conn.close()
+        invalidate_schedule_cache()
         return True
     except Exception as e:
         app_logger.error(f"Failed to update last run for schedule '{name}': {e}")
@@ -3844,6 +3888,9 @@ def get_weekly_packs_config():
     Get the Weekly Packs configuration.
     Reads non-schedule fields from weekly_packs_config, schedule fields from schedules table.
     """
+    cached, version = _schedule_cache_get(("weekly_packs_config",))
+    if cached is not None:
+        return {**cached, "publishers": list(cached["publishers"])}
     try:
         import json
 
@@ -3864,7 +3911,7 @@ def get_weekly_packs_config():
 
         sched = get_schedule("weekly_packs")
 
-        return {
+        weekly_config = {
             "enabled": bool(row["enabled"]),
             "format": row["format"],
             "publishers": json.loads(row["publishers"]) if row["publishers"] else [],
@@ -3875,6 +3922,8 @@ def get_weekly_packs_config():
             "time": sched["time"] if sched else "10:00",
             "last_run": sched["last_run"] if sched else None,
         }
+        _schedule_cache_put(("weekly_packs_config",), weekly_config, version)
+        return {**weekly_config, "publishers": list(weekly_config["publishers"])}
 
     except Exception as e:
         app_logger.error(f"Failed to get weekly packs config: {e}")
@@ -3914,6 +3963,7 @@ def save_weekly_packs_config(
 
         conn.commit()
         conn.close()
+        invalidate_schedule_cache()
 
         # Save schedule fields to unified table
         freq = "weekly" if enabled else "disabled"
@@ -3950,6 +4000,7 @@ def update_last_weekly_packs_run(pack_date=None):
                 )
                 conn.commit()
                 conn.close()
+                invalidate_schedule_cache()
 
         app_logger.info(
             f"Updated last weekly packs run timestamp (pack_date={pack_date})"
@@ -3993,6 +4044,7 @@ def log_weekly_pack_download(
 
         conn.commit()
         conn.close()
+        invalidate_schedule_cache()
 
         app_logger.info(
             f"Logged weekly pack download: {pack_date} {publisher} {format_pref} - {status}"
@@ -4034,6 +4086,7 @@ def update_weekly_pack_status(pack_date, publisher, format_pref, status):
 
         conn.commit()
         conn.close()
+        invalidate_schedule_cache()
 
         return True
 
@@ -4088,6 +4141,9 @@ def get_weekly_packs_history(limit=20):
     Returns:
         List of dictionaries with pack download history, or empty list on error
     """
+    cached, version = _schedule_cache_get(("weekly_packs_history", limit))
+    if cached is not None:
+        return [dict(entry) for entry in cached]
     try:
         conn = get_db_connection()
         if not conn:
@@ -4106,7 +4162,7 @@ def get_weekly_packs_history(limit=20):
         rows = c.fetchall()
         conn.close()
 
-        return [
+        history = [
             {
                 "pack_date": row[0],
                 "publisher": row[1],
@@ -4117,6 +4173,8 @@ def get_weekly_packs_history(limit=20):
             }
             for row in rows
         ]
+        _schedule_cache_put(("weekly_packs_history", limit), tuple(history), version)
+        return [dict(entry) for entry in history]
 
     except Exception as e:
         app_logger.error(f"Failed to get weekly packs history: {e}")
@@ -4793,6 +4851,58 @@ def mark_issue_read(
         return False
 
 
+def mark_issues_read_bulk(entries):
+    """
+    Mark multiple issues as read in a single transaction.
+
+    Args:
+        entries: List of dicts with issue_path and, optionally, the other
+                 mark_issue_read() arguments (read_at, page_count, time_spent,
+                 writer, penciller, characters, publisher)
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not entries:
+        return True
+
+    conn = None
+    try:
+        conn = get_db_connection()
+        if not conn:
+            return False
+
+        with conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO issues_read
+                (issue_path, read_at, page_count, time_spent, writer, penciller, characters, publisher)
+                VALUES (?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        e["issue_path"],
+                        e.get("read_at") or None,
+                        e.get("page_count", 0),
+                        e.get("time_spent", 0),
+                        e.get("writer", ""),
+                        e.get("penciller", ""),
+                        e.get("characters", ""),
+                        e.get("publisher", ""),
+                    )
+                    for e in entries
+                ],
+            )
+        app_logger.info(f"Marked {len(entries)} issues as read")
+        return True
+    except Exception as e:
+        app_logger.error(f"Failed to mark issues as read in bulk: {e}")
+        return False
+    finally:
+        if conn:
+            conn.close()
+
+
 def unmark_issue_read(issue_path):
     """
     Remove read status from an issue.
@@ -6931,88 +7041,82 @@ def get_on_the_stack_items(limit=10):
             return []
 
         c = conn.cursor()
+        # pos numbers each series' issues in reading order. A series qualifies
+        # once any issue is read; its next issue is the first unread one after
+        # the earliest read position.
         c.execute("""
+            WITH ordered AS (
+                SELECT
+                    s.id as series_id,
+                    s.name as series_name,
+                    s.cover_image,
+                    s.status as series_status,
+                    cs.issue_number,
+                    cs.file_path,
+                    i.image as issue_image,
+                    ir.issue_path IS NOT NULL as is_read,
+                    ir.read_at,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY s.id ORDER BY CAST(cs.issue_number AS REAL)
+                    ) as pos
+                FROM series s
+                JOIN collection_status cs ON s.id = cs.series_id
+                JOIN issues i ON cs.issue_id = i.id
+                LEFT JOIN issues_read ir ON cs.file_path = ir.issue_path
+                WHERE s.mapped_path IS NOT NULL
+                  AND cs.found = 1
+                  AND (
+                    s.series_subscription = 1
+                    OR (s.series_subscription IS NULL AND s.status = 'Ongoing')
+                  )
+            ),
+            read_series AS (
+                SELECT
+                    series_id,
+                    MIN(CASE WHEN is_read THEN pos END) as first_read_pos,
+                    NULLIF(MAX(CASE WHEN is_read THEN read_at END), '') as last_read_at
+                FROM ordered
+                GROUP BY series_id
+                HAVING first_read_pos IS NOT NULL
+            ),
+            next_unread AS (
+                SELECT
+                    o.*,
+                    r.last_read_at,
+                    ROW_NUMBER() OVER (PARTITION BY o.series_id ORDER BY o.pos) as rn
+                FROM ordered o
+                JOIN read_series r ON r.series_id = o.series_id
+                WHERE NOT o.is_read AND o.pos > r.first_read_pos
+            )
             SELECT
-                s.id as series_id,
-                s.name as series_name,
-                s.cover_image,
-                s.status as series_status,
-                s.series_subscription,
-                cs.issue_number,
-                cs.file_path,
-                i.image as issue_image,
-                CASE WHEN ir.issue_path IS NOT NULL THEN 1 ELSE 0 END as is_read,
-                ir.read_at
-            FROM series s
-            JOIN collection_status cs ON s.id = cs.series_id
-            JOIN issues i ON cs.issue_id = i.id
-            LEFT JOIN issues_read ir ON cs.file_path = ir.issue_path
-            WHERE s.mapped_path IS NOT NULL
-              AND cs.found = 1
-              AND (
-                s.series_subscription = 1
-                OR (s.series_subscription IS NULL AND s.status = 'Ongoing')
-              )
-            ORDER BY s.id, CAST(cs.issue_number AS REAL)
-        """)
+                series_id,
+                series_name,
+                issue_number,
+                file_path,
+                COALESCE(NULLIF(issue_image, ''), cover_image) as cover_image,
+                last_read_at,
+                series_status
+            FROM next_unread
+            WHERE rn = 1
+            ORDER BY COALESCE(last_read_at, '') DESC, series_id
+            LIMIT ?
+        """, (max(int(limit), 0),))
 
         rows = c.fetchall()
         conn.close()
 
-        # Group by series_id
-        from collections import OrderedDict
-        series_groups = OrderedDict()
-        for row in rows:
-            row_dict = dict(row)
-            sid = row_dict["series_id"]
-            if sid not in series_groups:
-                series_groups[sid] = []
-            series_groups[sid].append(row_dict)
-
         results = []
-        for sid, issues in series_groups.items():
-            # Find if any issue has been read
-            has_read = any(iss["is_read"] for iss in issues)
-            if not has_read:
-                continue
-
-            # Find the first unread issue where at least one prior issue is read
-            last_read_at = None
-            found_read = False
-            next_unread = None
-            for iss in issues:
-                if iss["is_read"]:
-                    found_read = True
-                    if iss["read_at"]:
-                        if last_read_at is None or iss["read_at"] > last_read_at:
-                            last_read_at = iss["read_at"]
-                elif found_read and next_unread is None:
-                    next_unread = iss
-
-            if next_unread is None:
-                continue
-
-            file_name = next_unread["file_path"]
+        for row in rows:
+            item = dict(row)
+            file_name = item["file_path"]
             if "/" in file_name:
                 file_name = file_name.split("/")[-1]
             elif "\\" in file_name:
                 file_name = file_name.split("\\")[-1]
+            item["file_name"] = file_name
+            results.append(item)
 
-            results.append({
-                "series_id": next_unread["series_id"],
-                "series_name": next_unread["series_name"],
-                "issue_number": next_unread["issue_number"],
-                "file_path": next_unread["file_path"],
-                "file_name": file_name,
-                "cover_image": next_unread["issue_image"] or next_unread["cover_image"],
-                "last_read_at": last_read_at,
-                "series_status": next_unread["series_status"],
-            })
-
-        # Sort by last_read_at descending (most recently read series first)
-        results.sort(key=lambda x: x["last_read_at"] or "", reverse=True)
-
-        return results[:limit]
+        return results
 
     except Exception as e:
         app_logger.error(f"Failed to get on the stack items: {e}")
@@ -9032,6 +9136,31 @@ def save_collection_status_bulk(entries):
     if not entries:
         return True
 
+    return save_collection_status_bulk_tuples(
+        (
+            e["series_id"],
+            e["issue_id"],
+            e["issue_number"],
+            e["found"],
+            e["file_path"],
+            e["file_mtime"],
+            e["matched_via"],
+        )
+        for e in entries
+    )
+
+
+def save_collection_status_bulk_tuples(rows):
+    """
+    Save collection status rows given as tuples, in a transaction.
+
+    Args:
+        rows: Iterable of (series_id, issue_id, issue_number, found, file_path,
+              file_mtime, matched_via) tuples; consumed directly by executemany
+
+    Returns:
+        True if successful, False otherwise
+    """
     conn = None
     try:
         conn = get_db_connection()
@@ -9045,21 +9174,10 @@ def save_collection_status_bulk(entries):
             (series_id, issue_id, issue_number, found, file_path, file_mtime, matched_via, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """,
-            [
-                (
-                    e["series_id"],
-                    e["issue_id"],
-                    e["issue_number"],
-                    e["found"],
-                    e["file_path"],
-                    e["file_mtime"],
-                    e["matched_via"],
-                )
-                for e in entries
-            ],
+            rows,
         )
         conn.commit()
-        app_logger.debug(f"Saved {len(entries)} collection status entries")
+        app_logger.debug(f"Saved {c.rowcount} collection status entries")
         return True
     except Exception as e:
         app_logger.error(f"Failed to save collection status bulk: {e}")
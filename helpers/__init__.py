@@ -7,6 +7,8 @@ import re
 import stat
 import tempfile
 import zipfile
+import copy
+import struct
 from PIL import Image, ImageEnhance, ImageFilter, ImageOps
 import math
 import shutil
@@ -232,6 +234,93 @@ def open_zip_for_write(dest_path, compression=zipfile.ZIP_DEFLATED,
             except OSError:
                 pass
 
+
+def _zip_strip_extra():
+    """Return zipfile's private extra-field stripper, or None if it moved.
+
+    It is ``zipfile._strip_extra`` up to 3.12 and ``zipfile._Extra.strip``
+    from 3.13 on.
+    """
+    strip = getattr(zipfile, "_strip_extra", None)
+    if strip is None:
+        strip = getattr(getattr(zipfile, "_Extra", None), "strip", None)
+    return strip
+
+
+# Private zipfile internals the raw copy leans on; checked before writing so a
+# Python release that renames one falls back to a normal copy.
+_RAW_COPY_MODULE_ATTRS = (
+    "_FH_SIGNATURE", "_FH_FILENAME_LENGTH", "_FH_EXTRA_FIELD_LENGTH",
+    "_MASK_USE_DATA_DESCRIPTOR",
+)
+_RAW_COPY_WRITER_ATTRS = ("_lock", "_writecheck", "_didModify", "_seekable", "start_dir")
+
+
+def copy_zip_member_raw(src_zip, dst_zip, info, chunk_size=1024 * 1024):
+    """Append ``info`` from ``src_zip`` to ``dst_zip`` without recompressing it.
+
+    The member's compressed bytes are copied verbatim behind a fresh local
+    header, so rewriting a CBZ to drop one entry costs disk I/O only instead of
+    inflating and deflating every page. ``dst_zip`` must be open for writing
+    and not have another member open.
+
+    This relies on private zipfile internals. If any of them is missing on the
+    running interpreter the member is decompressed and rewritten with
+    ``writestr`` instead.
+    """
+    strip_extra = _zip_strip_extra()
+    if (
+        strip_extra is None
+        or not all(hasattr(zipfile, name) for name in _RAW_COPY_MODULE_ATTRS)
+        or not all(hasattr(dst_zip, name) for name in _RAW_COPY_WRITER_ATTRS)
+    ):
+        _copy_zip_member_recompress(src_zip, dst_zip, info)
+        return
+
+    try:
+        src = src_zip.fp
+        src.seek(info.header_offset)
+        fheader = struct.unpack(zipfile.structFileHeader, src.read(zipfile.sizeFileHeader))
+        if fheader[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {info.filename!r}")
+        src.seek(fheader[zipfile._FH_FILENAME_LENGTH] + fheader[zipfile._FH_EXTRA_FIELD_LENGTH], 1)
+
+        zinfo = copy.copy(info)
+        # Sizes and CRC go in the new local header, so no trailing data descriptor;
+        # FileHeader() re-adds the zip64 extra itself when it is needed.
+        zinfo.flag_bits &= ~zipfile._MASK_USE_DATA_DESCRIPTOR
+        zinfo.extra = strip_extra(zinfo.extra, (1,))
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    except AttributeError:
+        # Nothing has been written to dst_zip yet, so a normal copy is safe.
+        _copy_zip_member_recompress(src_zip, dst_zip, info)
+        return
+
+    # Same bookkeeping ZipFile.mkdir() does for a member written in one go.
+    with dst_zip._lock:
+        dst_zip._writecheck(zinfo)
+        dst_zip._didModify = True
+        dst = dst_zip.fp
+        if dst_zip._seekable:
+            dst.seek(dst_zip.start_dir)
+        zinfo.header_offset = dst.tell()
+        dst.write(zinfo.FileHeader(zip64))
+        remaining = zinfo.compress_size
+        while remaining:
+            chunk = src.read(min(chunk_size, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for {info.filename!r}")
+            dst.write(chunk)
+            remaining -= len(chunk)
+        dst_zip.start_dir = dst.tell()
+        dst_zip.filelist.append(zinfo)
+        dst_zip.NameToInfo[zinfo.filename] = zinfo
+
+
+def _copy_zip_member_recompress(src_zip, dst_zip, info):
+    """Portable fallback for copy_zip_member_raw(): inflate and re-deflate."""
+    dst_zip.writestr(copy.copy(info), src_zip.read(info))
+
 #########################
 #   Folder Thumbnails   #
 #########################
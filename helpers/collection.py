@@ -1,6 +1,7 @@
 import os
 import re
 import logging
+import functools
 from core.config import config
 from core.app_logging import app_logger
 
@@ -170,28 +171,21 @@ def get_series_name_from_files(mapped_path, db_series_name):
     return db_series_name
 
 
-def generate_filename_pattern(custom_pattern, series_name, issue_number):
+@functools.lru_cache(maxsize=1024)
+def _series_template(custom_pattern, series_name):
     """
-    Convert CUSTOM_RENAME_PATTERN to a precise regex for matching a specific issue.
+    Build the issue-independent part of a filename regex.
 
-    Pattern placeholders:
-    - {series_name} -> matches the series name (flexible whitespace/case)
-    - {issue_number} -> matches the issue number (with optional leading zeros)
-    - {volume_year}/{issue_year} (and legacy {year}) -> matches any 4-digit year
-    - {issue_month_m} -> matches a 2-digit month
-    - {issue_month_M} -> matches a month name
-    Any other (unrecognized) {token} is stripped defensively so it never leaks
-    into the compiled regex as a literal requirement.
-
-    Args:
-        custom_pattern: The rename pattern from config (e.g., "{series_name} {issue_number} ({volume_year})")
-        series_name: The series name to match
-        issue_number: The issue number to match
+    Everything in a CUSTOM_RENAME_PATTERN regex except the issue number depends
+    only on the pattern and the series name, so it is built once per series and
+    the issue number is swapped in afterwards (see generate_filename_pattern).
+    Memoized, since the same pattern/series pair is used for every issue of a
+    series and again on every rescan.
 
     Returns:
-        Compiled regex pattern or None if pattern is invalid
+        Regex source with a ``<<<ISSUE>>>`` placeholder for the issue number,
+        or None if the pattern cannot be built.
     """
-
     if not custom_pattern or not series_name:
         return None
 
@@ -203,7 +197,7 @@ def generate_filename_pattern(custom_pattern, series_name, issue_number):
         # Use placeholders to protect our variable markers
         pattern = custom_pattern
         pattern = pattern.replace('{series_name}', '<<<SERIES>>>')
-        pattern = pattern.replace('{issue_number}', '<<<ISSUE>>>')
+        pattern = pattern.replace('{issue_number}', '<<<ISSUEGROUP>>>')
         # Year variants — all match any 4-digit year
         for tok in ('{volume_year}', '{issue_year}', '{year}'):  # {year} is a legacy fallback
             pattern = pattern.replace(tok, '<<<YEAR>>>')
@@ -236,27 +230,31 @@ def generate_filename_pattern(custom_pattern, series_name, issue_number):
         # Build series pattern word-by-word, making common connecting words optional
         # Files often omit words like "and", "of", "the" (e.g., "Magik Colossus" for "Magik and Colossus")
         OPTIONAL_WORDS = {'and', 'the', 'of', 'or', 'vs', 'versus'}
-        sep = r"[\s\-_:'\.&\u2010-\u2015\u2212]*"
+        # Possessive separator: words never start with a separator character,
+        # so giving back consumed separators can never produce a match. Without
+        # this, a non-matching filename makes the engine retry every split of
+        # each separator run between adjacent (optional) words. Each word owns
+        # the separator before it, so an optional word that is absent takes its
+        # separator with it instead of leaving an ambiguous empty match.
+        sep = r"[\s\-_:'\.&\u2010-\u2015\u2212]*+"
         words = normalized_name.split()
         pattern_parts = []
         for i, word in enumerate(words):
             escaped_word = re.escape(word)
+            lead = sep if i > 0 else ''
             if word.lower() in OPTIONAL_WORDS:
-                pattern_parts.append(f"(?:{escaped_word}{sep})?")
+                pattern_parts.append(f"(?:{lead}{escaped_word})?")
             else:
-                pattern_parts.append(escaped_word)
-                if i < len(words) - 1:
-                    pattern_parts.append(sep)
+                pattern_parts.append(f"{lead}{escaped_word}")
         series_pattern = the_prefix + ''.join(pattern_parts)
 
-        # Normalize issue number - handle leading zeros (1, 01, 001 all match)
-        issue_num_clean = str(issue_number).strip().lstrip('0') or '0'
-        # Match issue number with optional leading zeros
-        issue_pattern = r'0*' + re.escape(issue_num_clean) + r'(?!\d)'
-
-        # Now substitute our patterns back in
-        pattern = pattern.replace('<<<SERIES>>>', f'(?:{series_pattern})')
-        pattern = pattern.replace('<<<ISSUE>>>', f'({issue_pattern})')
+        # Now substitute our patterns back in. The issue number stays a
+        # placeholder, but its capture group is added here so the ") ("
+        # rewrite below sees the same shape as a fully substituted pattern.
+        # Atomic group: once the series name has matched, the engine never
+        # re-enters it to try a different split of its optional words.
+        pattern = pattern.replace('<<<SERIES>>>', f'(?>{series_pattern})')
+        pattern = pattern.replace('<<<ISSUEGROUP>>>', '(<<<ISSUE>>>)')
         pattern = pattern.replace('<<<YEAR>>>', r'\d{4}')
         pattern = pattern.replace('<<<MONTHNUM>>>', r'\d{2}')
         pattern = pattern.replace('<<<MONTHNAME>>>', r'[A-Za-z]+')
@@ -279,13 +277,95 @@ def generate_filename_pattern(custom_pattern, series_name, issue_number):
         # Add file extension matching at the end
         pattern += r'.*\.(?:cbz|cbr|zip|rar)$'
 
-        return re.compile(pattern, re.IGNORECASE)
+        return pattern
+
+    except Exception as e:
+        app_logger.debug(f"Failed to generate filename pattern: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _issue_number_pattern(issue_number):
+    """Regex fragment matching ``issue_number`` with optional leading zeros."""
+    # Normalize issue number - handle leading zeros (1, 01, 001 all match)
+    issue_num_clean = str(issue_number).strip().lstrip('0') or '0'
+    # Match issue number with optional leading zeros (atomic: a rejected
+    # number is not retried with fewer leading zeros)
+    return r'(?>0*' + re.escape(issue_num_clean) + r')(?!\d)'
+
 
+def _compile_issue_pattern(template, issue_number):
+    """Substitute an issue number into a ``_series_template`` and compile it."""
+    if not template:
+        return None
+
+    try:
+        issue_pattern = _issue_number_pattern(issue_number)
+        return re.compile(template.replace('<<<ISSUE>>>', issue_pattern), re.IGNORECASE)
     except Exception as e:
         app_logger.debug(f"Failed to generate filename pattern: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def generate_filename_pattern(custom_pattern, series_name, issue_number):
+    """
+    Convert CUSTOM_RENAME_PATTERN to a precise regex for matching a specific issue.
+
+    Pattern placeholders:
+    - {series_name} -> matches the series name (flexible whitespace/case)
+    - {issue_number} -> matches the issue number (with optional leading zeros)
+    - {volume_year}/{issue_year} (and legacy {year}) -> matches any 4-digit year
+    - {issue_month_m} -> matches a 2-digit month
+    - {issue_month_M} -> matches a month name
+    Any other (unrecognized) {token} is stripped defensively so it never leaks
+    into the compiled regex as a literal requirement.
+
+    Results are memoized: the same (pattern, series, issue) triple is requested
+    repeatedly across scans, and compiled patterns are immutable.
+
+    Args:
+        custom_pattern: The rename pattern from config (e.g., "{series_name} {issue_number} ({volume_year})")
+        series_name: The series name to match
+        issue_number: The issue number to match
+
+    Returns:
+        Compiled regex pattern or None if pattern is invalid
+    """
+    return _compile_issue_pattern(
+        _series_template(custom_pattern, series_name), issue_number
+    )
+
+
+# Top-level ComicInfo.xml elements extract_comicinfo needs -> result keys
+_COMICINFO_FIELDS = {'Series': 'series', 'Number': 'number', 'Volume': 'volume', 'Year': 'year'}
+
+
+def _read_comicinfo_fields(events):
+    """Collect the _COMICINFO_FIELDS from an ``iterparse`` event stream.
+
+    Only direct children of the root count (like ``root.findtext``), and
+    parsing stops as soon as all four are seen, so long summaries and page
+    lists after them are never parsed.
+    """
+    result = {key: '' for key in _COMICINFO_FIELDS.values()}
+    seen = 0
+    depth = 0
+    for event, elem in events:
+        if event == 'start':
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and elem.tag in _COMICINFO_FIELDS:
+            result[_COMICINFO_FIELDS[elem.tag]] = elem.text or ''
+            seen += 1
+            if seen == len(_COMICINFO_FIELDS):
+                break
+        if depth >= 1:
+            elem.clear()
+    return result
+
+
 def extract_comicinfo(file_path):
     """
     Extract ComicInfo.xml from a CBZ file.
@@ -308,14 +388,7 @@ def extract_comicinfo(file_path):
             comicinfo_path = find_comicinfo_in_zip(zf)
             if comicinfo_path:
                 with zf.open(comicinfo_path) as ci:
-                    tree = SafeET.parse(ci)
-                    root = tree.getroot()
-                    return {
-                        'series': root.findtext('Series', ''),
-                        'number': root.findtext('Number', ''),
-                        'volume': root.findtext('Volume', ''),
-                        'year': root.findtext('Year', '')
-                    }
+                    return _read_comicinfo_fields(SafeET.iterparse(ci, events=('start', 'end')))
     except Exception:
         pass
 
@@ -340,6 +413,26 @@ def extract_comicinfo_cached(file_path, cache):
     return cache[file_path]
 
 
+def prefetch_comicinfo(file_paths, cache, max_workers=8):
+    """Read ComicInfo.xml for many archives concurrently into ``cache``.
+
+    Same cache contract as ``extract_comicinfo_cached``. Reading an archive is
+    I/O-bound (and zlib releases the GIL), so a small thread pool overlaps the
+    reads — a large win on spinning disks and network shares.
+    """
+    pending = [
+        p for p in file_paths
+        if p not in cache and p.lower().endswith((".cbz", ".zip"))
+    ]
+    if len(pending) < 2:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        for path, ci in zip(pending, executor.map(extract_comicinfo, pending)):
+            cache[path] = ci or {}
+
+
 def match_wanted_issues_to_files(wanted, files, match_pattern, alias_lookup=None):
     """Match wanted issues against a pool of files without touching the filesystem.
 
@@ -477,6 +570,49 @@ def match_wanted_issues_to_files(wanted, files, match_pattern, alias_lookup=None
     return matches
 
 
+_DIGIT_RUN = re.compile(r'\d+')
+
+
+def _extract_issue_numbers_from_filename(filename):
+    """
+    Return every issue number a filename regex could match in ``filename``.
+
+    The filename regexes match an issue number as ``0*<number>`` not followed by
+    another digit, i.e. some suffix of a run of digits. Each such suffix is
+    returned with its leading zeros stripped, so a file can be indexed once and
+    looked up by the normalized issue number instead of rescanned per issue.
+
+    Returns:
+        Set of normalized issue-number strings (e.g. {"2099", "99", "9", "44", "4"})
+    """
+    numbers = set()
+    for run in _DIGIT_RUN.findall(filename):
+        for i in range(len(run)):
+            numbers.add(run[i:].lstrip('0') or '0')
+    return numbers
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_fallback_patterns(check_num):
+    """Compiled generic issue-number patterns for the last-resort filename match.
+
+    Args:
+        check_num: Issue number with leading zeros stripped ("0" for zero)
+
+    Returns:
+        Tuple of compiled patterns, tried in order.
+    """
+    escaped = re.escape(check_num)
+    return (
+        re.compile(rf'[\s\-_]0*{escaped}(?:[\s\-_\.\(]|$)', re.IGNORECASE),  # space/dash/underscore + number + delimiter
+        re.compile(rf'#0*{escaped}(?:\D|$)', re.IGNORECASE),  # #1, #01, #001
+    )
+
+
+def _get_attr(obj, name):
+    return getattr(obj, name, None)
+
+
 def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True):
     """
     Match Metron issues to local files in the mapped directory with caching.
@@ -498,7 +634,7 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
     """
     from core.database import (
         get_collection_status_for_series,
-        save_collection_status_bulk,
+        save_collection_status_bulk_tuples,
     )
 
     results = {}
@@ -515,20 +651,19 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
             # Validate cache by checking file existence and mtime
             valid_cache = True
             for entry in cached:
-                if entry['file_path']:
-                    if not os.path.exists(entry['file_path']):
-                        valid_cache = False
-                        app_logger.debug(f"Cache invalid: file no longer exists {entry['file_path']}")
-                        break
-                    try:
-                        current_mtime = os.path.getmtime(entry['file_path'])
-                        if entry['file_mtime'] and abs(current_mtime - entry['file_mtime']) > 1:
-                            valid_cache = False
-                            app_logger.debug(f"Cache invalid: mtime changed for {entry['file_path']}")
-                            break
-                    except OSError:
-                        valid_cache = False
-                        break
+                if not entry['file_path']:
+                    continue
+                # One stat covers both the existence and the mtime check
+                try:
+                    st = os.stat(entry['file_path'])
+                except OSError:
+                    valid_cache = False
+                    app_logger.debug(f"Cache invalid: file no longer exists {entry['file_path']}")
+                    break
+                if entry['file_mtime'] and abs(st.st_mtime - entry['file_mtime']) > 1:
+                    valid_cache = False
+                    app_logger.debug(f"Cache invalid: mtime changed for {entry['file_path']}")
+                    break
 
             # Detect newly-added files that could satisfy a still-missing issue.
             # The existence/mtime loop above only re-validates issues that were
@@ -541,10 +676,13 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
             if valid_cache and any(not entry['found'] for entry in cached):
                 found_paths = {e['file_path'] for e in cached if e['file_path']}
                 try:
-                    current_comic_count = sum(
-                        1 for f in os.listdir(mapped_path)
-                        if f.lower().endswith(comic_extensions)
-                    )
+                    # Same filter as the scan below, or a directory named
+                    # like a comic would keep invalidating the cache
+                    with os.scandir(mapped_path) as it:
+                        current_comic_count = sum(
+                            1 for f in it
+                            if f.name.lower().endswith(comic_extensions) and f.is_file()
+                        )
                     if current_comic_count > len(found_paths):
                         valid_cache = False
                         app_logger.debug(
@@ -571,14 +709,20 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
     file_metadata = {}
 
     try:
-        for filename in os.listdir(mapped_path):
-            if filename.lower().endswith(comic_extensions):
-                file_path = os.path.join(mapped_path, filename)
-                local_files.append(file_path)
+        # scandir yields the joined path and file type without extra syscalls
+        with os.scandir(mapped_path) as it:
+            for entry in it:
+                filename = entry.name
+                if not filename.lower().endswith(comic_extensions):
+                    continue
                 try:
-                    mtime = os.path.getmtime(file_path)
+                    if not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime
                 except OSError:
                     mtime = None
+                file_path = entry.path
+                local_files.append(file_path)
                 file_metadata[file_path] = {
                     'filename': filename,
                     'path': file_path,
@@ -592,15 +736,38 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
     from core.database import get_user_preference
     custom_pattern = get_user_preference('custom_rename_pattern', default='') or ''
 
-    # Step 4: Match each issue
-    cache_entries = []
+    # Step 4: Match each issue, recording one
+    # (issue_num, issue_id, found, file_path, matched_via, mtime) per issue
+    decisions = []
+    # The series-level part of the filename regex does not depend on the issue,
+    # so build it once and only swap the issue number in per issue.
+    series_template = (
+        _series_template(custom_pattern, series_name)
+        if custom_pattern and series_name else None
+    )
     # ComicInfo.xml is read at most once per file across all issues (shared with
     # the scan path via extract_comicinfo_cached).
     comicinfo_cache = {}
+    comicinfo_prefetched = False
+    # Index every file by the issue numbers its name could contain, so the
+    # filename matchers only test the few files that can possibly match an
+    # issue instead of rescanning the whole folder per issue. Lists keep the
+    # directory order, so the first matching file is the same as before.
+    issue_index = {}
+    for file_path, metadata in file_metadata.items():
+        for num in _extract_issue_numbers_from_filename(metadata['filename']):
+            issue_index.setdefault(num, []).append(file_path)
+
+    # Issues are either all dicts or all IssueObj-style objects, so pick the
+    # field accessor once rather than probing both shapes for every field.
+    if issues and isinstance(issues[0], dict):
+        get_field = dict.get
+    else:
+        get_field = _get_attr
 
     for issue in issues:
-        issue_num = str(getattr(issue, 'number', '') or (issue.get('number', '') if isinstance(issue, dict) else ''))
-        issue_id = getattr(issue, 'id', None) or (issue.get('id') if isinstance(issue, dict) else None)
+        issue_num = str(get_field(issue, 'number') or '')
+        issue_id = get_field(issue, 'id')
 
         if not issue_num:
             continue
@@ -608,13 +775,19 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
         match_found = False
         matched_file = None
         matched_via = None
+        check_num = issue_num.strip().lstrip('0') or '0'
+        # Non-numeric issue numbers ("1.5", "1A") aren't indexed; scan them all.
+        if check_num.isdecimal():
+            filename_candidates = issue_index.get(check_num, [])
+        else:
+            filename_candidates = list(file_metadata)
 
         # 4a: Try CUSTOM_RENAME_PATTERN matching first (most reliable for user's files)
-        if custom_pattern and series_name:
-            pattern_regex = generate_filename_pattern(custom_pattern, series_name, issue_num)
+        if series_template:
+            pattern_regex = _compile_issue_pattern(series_template, issue_num)
             if pattern_regex:
-                for file_path, metadata in file_metadata.items():
-                    if pattern_regex.search(metadata['filename']):
+                for file_path in filename_candidates:
+                    if pattern_regex.search(file_metadata[file_path]['filename']):
                         match_found = True
                         matched_file = file_path
                         matched_via = 'pattern'
@@ -622,13 +795,17 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
 
         # 4b: Fallback to ComicInfo.xml matching
         if not match_found:
+            # The first issue to get here will read (nearly) every archive, so
+            # read them all concurrently up front.
+            if not comicinfo_prefetched:
+                prefetch_comicinfo(list(file_metadata), comicinfo_cache)
+                comicinfo_prefetched = True
             for file_path, metadata in file_metadata.items():
                 # Lazy-load ComicInfo.xml only when needed (once per file).
                 ci = extract_comicinfo_cached(file_path, comicinfo_cache)
                 if ci.get('number'):
                     # Normalize issue numbers for comparison
                     meta_num = str(ci['number']).strip().lstrip('0') or '0'
-                    check_num = issue_num.strip().lstrip('0') or '0'
 
                     if meta_num == check_num:
                         # Check series name matches (loose match)
@@ -641,16 +818,13 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
 
         # 4c: Final fallback to generic filename patterns
         if not match_found:
-            check_num = issue_num.strip().lstrip('0') or '0'
-            patterns = [
-                rf'[\s\-_]0*{re.escape(check_num)}(?:[\s\-_\.\(]|$)',  # space/dash/underscore + number + delimiter
-                rf'#0*{re.escape(check_num)}(?:\D|$)',  # #1, #01, #001
-            ]
+            patterns = _build_fallback_patterns(check_num)
 
-            for file_path, metadata in file_metadata.items():
-                filename = metadata['filename']
+            # Same index as 4a: only files whose name can hold this number
+            for file_path in filename_candidates:
+                filename = file_metadata[file_path]['filename']
                 for pattern in patterns:
-                    if re.search(pattern, filename, re.IGNORECASE):
+                    if pattern.search(filename):
                         match_found = True
                         matched_file = file_path
                         matched_via = 'filename'
@@ -658,27 +832,29 @@ def match_issues_to_collection(mapped_path, issues, series_info, use_cache=True)
                 if match_found:
                     break
 
-        results[issue_num] = {
-            'found': match_found,
-            'file_path': matched_file
-        }
-
-        # Prepare cache entry
-        if series_id and issue_id:
-            cache_entries.append({
-                'series_id': series_id,
-                'issue_id': issue_id,
-                'issue_number': issue_num,
-                'found': 1 if match_found else 0,
-                'file_path': matched_file,
-                'file_mtime': file_metadata.get(matched_file, {}).get('mtime') if matched_file else None,
-                'matched_via': matched_via
-            })
+        decisions.append((
+            issue_num,
+            issue_id,
+            match_found,
+            matched_file,
+            matched_via,
+            file_metadata[matched_file]['mtime'] if matched_file else None,
+        ))
+
+    results = {
+        issue_num: {'found': found, 'file_path': file_path}
+        for issue_num, _, found, file_path, _, _ in decisions
+    }
+    cache_rows = [
+        (series_id, issue_id, issue_num, 1 if found else 0, file_path, mtime, matched_via)
+        for issue_num, issue_id, found, file_path, matched_via, mtime in decisions
+        if series_id and issue_id
+    ]
 
     # Step 5: Save to cache
-    if cache_entries:
-        save_collection_status_bulk(cache_entries)
-        app_logger.debug(f"Cached collection status for series {series_id} ({len(cache_entries)} issues)")
+    if cache_rows:
+        save_collection_status_bulk_tuples(cache_rows)
+        app_logger.debug(f"Cached collection status for series {series_id} ({len(cache_rows)} issues)")
 
     return results
 
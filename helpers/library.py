@@ -1,8 +1,81 @@
 import os
+import time
 import tempfile
+import threading
 from core.app_logging import app_logger
 
 
+# ---- Enabled-libraries cache ------------------------------------------------
+# Library lookups run on nearly every request (and per file during scans), but
+# the libraries table only changes through add/update/delete_library, which
+# invalidate this cache. The TTL bounds staleness for writes made elsewhere.
+
+_LIBRARIES_CACHE_TTL = 30.0  # seconds
+_libraries_cache = {
+    'expires': 0.0, 'libraries': None, 'roots': (), 'root_set': frozenset(),
+    'prefixes': (), 'by_root': {}, 'nested': False,
+}
+_libraries_cache_lock = threading.Lock()
+_libraries_cache_version = 0   # bumped on every invalidation
+
+
+def _cached_libraries():
+    """Return the cache entry for enabled libraries, reloading it when stale.
+
+    Returns:
+        Dict with ``libraries`` (list of library dicts, as from
+        ``get_libraries(enabled_only=True)``), ``roots`` (tuple of
+        normalized library root paths, in the same order), ``root_set``
+        (the same roots as a frozenset), ``prefixes`` (each root plus a
+        trailing separator, for a single ``str.startswith`` call),
+        ``by_root`` (normalized root -> first library with that root) and
+        ``nested`` (True if any library root lies inside another).
+
+        The entry and the library dicts in it are shared between callers and
+        must not be mutated; public helpers hand out copies of library dicts.
+    """
+    with _libraries_cache_lock:
+        if _libraries_cache['libraries'] is not None and _libraries_cache['expires'] > time.monotonic():
+            return dict(_libraries_cache)
+        version = _libraries_cache_version
+
+    from core.database import get_libraries
+    libraries = tuple(get_libraries(enabled_only=True))
+    roots = tuple(os.path.normpath(lib['path']) for lib in libraries)
+    prefixes = tuple(root + os.sep for root in roots)
+    by_root = {}
+    for root, lib in zip(roots, libraries):
+        by_root.setdefault(root, lib)
+    entry = {
+        'expires': time.monotonic() + _LIBRARIES_CACHE_TTL,
+        'libraries': libraries,
+        'roots': roots,
+        'root_set': frozenset(roots),
+        'prefixes': prefixes,
+        'by_root': by_root,
+        'nested': any(root.startswith(prefixes) for root in roots),
+    }
+    with _libraries_cache_lock:
+        # Skip the store if the table changed while we were reading it
+        if version == _libraries_cache_version:
+            _libraries_cache.update(entry)
+    return entry
+
+
+def invalidate_libraries_cache():
+    """Drop the cached library list — call whenever the libraries table changes."""
+    global _libraries_cache_version
+    with _libraries_cache_lock:
+        _libraries_cache_version += 1
+        _libraries_cache['expires'] = 0.0
+        _libraries_cache['libraries'] = None
+        _libraries_cache['roots'] = ()
+        _libraries_cache['root_set'] = frozenset()
+        _libraries_cache['prefixes'] = ()
+        _libraries_cache['by_root'] = {}
+        _libraries_cache['nested'] = False
+
+
 def get_library_roots():
     """
     Get list of all enabled library root paths.
@@ -11,8 +84,7 @@ def get_library_roots():
         List of path strings for enabled libraries.
         Falls back to ['/data'] if no libraries configured.
     """
-    from core.database import get_libraries
-    libraries = get_libraries(enabled_only=True)
+    libraries = _cached_libraries()['libraries']
     if libraries:
         return [lib['path'] for lib in libraries]
     # Fallback for backwards compatibility
@@ -26,9 +98,8 @@ def get_default_library():
     Returns:
         Dictionary with library data, or None if no libraries configured.
     """
-    from core.database import get_libraries
-    libraries = get_libraries(enabled_only=True)
-    return libraries[0] if libraries else None
+    libraries = _cached_libraries()['libraries']
+    return dict(libraries[0]) if libraries else None
 
 
 def is_allowed_path(path):
@@ -68,12 +139,16 @@ def is_valid_library_path(path):
     if not path:
         return False
     normalized = os.path.normpath(path)
-    for root in get_library_roots():
-        root_normalized = os.path.normpath(root)
-        # Check if path equals root or is a subdirectory of root
-        if normalized == root_normalized or normalized.startswith(root_normalized + os.sep):
-            return True
-    return False
+    cached = _cached_libraries()
+    if not cached['roots']:
+        # No libraries configured: fall back to get_library_roots() (/data)
+        for root in get_library_roots():
+            root_normalized = os.path.normpath(root)
+            if normalized == root_normalized or normalized.startswith(root_normalized + os.sep):
+                return True
+        return False
+    # Path equals a root, or is a subdirectory of one
+    return normalized in cached['root_set'] or normalized.startswith(cached['prefixes'])
 
 
 def get_library_for_path(path):
@@ -88,15 +163,33 @@ def get_library_for_path(path):
     """
     if not path:
         return None
-    from core.database import get_libraries
     normalized = os.path.normpath(path)
-    for lib in get_libraries(enabled_only=True):
-        root = os.path.normpath(lib['path'])
-        if normalized == root or normalized.startswith(root + os.sep):
-            return lib
+    cached = _cached_libraries()
+    # A library root itself is a dict hit. With nested libraries the first
+    # library (by name) containing the path wins, so only the scan below
+    # gives the right answer there.
+    if not cached['nested']:
+        lib = cached['by_root'].get(normalized)
+        if lib is not None:
+            return dict(lib)
+    for lib, root, prefix in zip(cached['libraries'], cached['roots'], cached['prefixes']):
+        if normalized == root or normalized.startswith(prefix):
+            return dict(lib)
     return None
 
 
+def _is_ancestor(parent, child):
+    """True if ``child`` is ``parent`` or lies inside it (component-wise, so
+    "/down" is not an ancestor of "/downloads")."""
+    parent = os.path.normpath(parent)
+    child = os.path.normpath(child)
+    if child == parent:
+        return True
+    if not parent.endswith(os.sep):
+        parent += os.sep
+    return child.startswith(parent)
+
+
 def is_critical_path(path):
     """
     Check if a path is a critical system path (WATCH, TARGET, or TRASH folders).
@@ -111,12 +204,8 @@ def is_critical_path(path):
     watch_folder = get_watch_dir() or "/downloads/temp"
     target_folder = get_target_dir() or "/downloads/processed"
 
-    # Check if path is exactly a critical folder
-    if path == watch_folder or path == target_folder:
-        return True
-
-    # Check if path is a parent directory of critical folders
-    if (path in watch_folder and watch_folder.startswith(path)) or (path in target_folder and target_folder.startswith(path)):
+    # Check if path is exactly a critical folder or a parent directory of one
+    if _is_ancestor(path, watch_folder) or _is_ancestor(path, target_folder):
         return True
 
     # Protect the trash directory root
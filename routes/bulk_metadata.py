@@ -261,12 +261,7 @@ def progress(job_id):
     app_state op has been pruned (app_state expires completed ops after 15s).
     """
     op_id = get_op_id_for_job(job_id)
-    op = None
-    if op_id:
-        for o in app_state.get_active_operations():
-            if o["id"] == op_id:
-                op = o
-                break
+    op = app_state.get_operation(op_id) if op_id else None
 
     job = get_bulk_job(job_id)
     if not job:
@@ -304,16 +299,16 @@ def op_progress(op_id):
     update_operation calls. Returns 404 once the operation has been pruned
     (app_state expires completed ops after a short TTL).
     """
-    for op in app_state.get_active_operations():
-        if op["id"] == op_id:
-            return jsonify({
-                "success": True,
-                "status": op["status"],
-                "current": op["current"],
-                "total": op["total"],
-                "detail": op["detail"],
-            })
-    return jsonify({"success": False, "error": "operation not found"}), 404
+    op = app_state.get_operation(op_id)
+    if op is None:
+        return jsonify({"success": False, "error": "operation not found"}), 404
+    return jsonify({
+        "success": True,
+        "status": op["status"],
+        "current": op["current"],
+        "total": op["total"],
+        "detail": op["detail"],
+    })
 
 
 @bulk_metadata_bp.route('/api/bulk-metadata/jobs', methods=['GET'])
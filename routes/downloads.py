@@ -8,11 +8,19 @@ Provides routes for:
 - Weekly packs configuration, history, and status
 """
 
-import uuid
+import functools
+import json
+import re
+import secrets
 import threading
 import time
-from datetime import datetime, timedelta, date
-from flask import Blueprint, request, jsonify, render_template
+from datetime import datetime, date
+from flask import Blueprint, request, jsonify, render_template, current_app
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import core.app_state as app_state
 from core.app_logging import app_logger
 from core.database import (
@@ -36,6 +44,147 @@ from core.config import config
 
 downloads_bp = Blueprint('downloads', __name__)
 
+# Schedule times are H:M on a 24-hour clock; leading zeros are optional.
+_TIME_RE = re.compile(r'(?:[01]?\d|2[0-3]):[0-5]?\d')
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_WEEKLY_PACK_PUBLISHERS = ('DC', 'Marvel', 'Image', 'INDIE')
+_VALID_PUBLISHERS = frozenset(_WEEKLY_PACK_PUBLISHERS)
+# Schedule/config saves are a few hundred bytes; refuse anything far larger
+# before reading it.
+_MAX_SETTINGS_BODY = 16 * 1024
+
+
+def _json_response(payload, status=200):
+    """Serialize ``payload`` with orjson when available, else ``jsonify``.
+
+    Search results can run to hundreds of entries, so the faster encoder is
+    worth having; anything orjson refuses (e.g. Decimal) goes through Flask's
+    provider unchanged.
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            return current_app.response_class(body, status=status, mimetype='application/json')
+    response = jsonify(payload)
+    response.status_code = status
+    return response
+
+
+def _encode_constant(payload):
+    """Encode a fixed payload once at import time."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def _constant_response(body):
+    """Wrap pre-encoded JSON in a fresh response (hooks may mutate headers)."""
+    return current_app.response_class(body, mimetype='application/json')
+
+
+# Responses for the "nothing configured yet" branches never change.
+_GETCOMICS_SCHEDULE_UNSET = _encode_constant({
+    "success": True,
+    "schedule": {
+        "frequency": "disabled",
+        "time": "03:00",
+        "weekday": 0
+    },
+    "next_run": "Not scheduled",
+    "last_run": None
+})
+_WEEKLY_PACKS_CONFIG_UNSET = _encode_constant({
+    "success": True,
+    "config": {
+        "enabled": False,
+        "format": "JPG",
+        "publishers": [],
+        "weekday": 2,
+        "time": "10:00",
+        "retry_enabled": True,
+        "start_date": None
+    },
+    "next_run": "Not scheduled",
+    "last_run": None,
+    "last_successful_pack": None,
+    "start_date": None
+})
+
+
+# Manual "run now" triggers go to the shared scheduler as one-shot jobs, or to
+# a daemon thread when the scheduler isn't running (so a long download never
+# holds up interpreter exit). Each job runs at most once at a time.
+_run_now_in_flight = {}
+_run_now_lock = threading.Lock()
+
+
+def _scheduler_running():
+    """True when ``app_state.scheduler`` is started and not paused."""
+    try:
+        from apscheduler.schedulers.base import STATE_RUNNING
+    except ImportError:
+        return False
+    return getattr(app_state.scheduler, 'state', None) == STATE_RUNNING
+
+
+def _submit_run_now(name, target):
+    """Start ``target`` in the background; False if ``name`` is already running."""
+    with _run_now_lock:
+        in_flight = _run_now_in_flight.setdefault(name, threading.Event())
+        if in_flight.is_set():
+            return False
+        in_flight.set()
+
+    def run():
+        try:
+            target()
+        finally:
+            in_flight.clear()
+
+    try:
+        if _scheduler_running():
+            # No misfire grace limit: a dropped run would leave the flag set.
+            app_state.scheduler.add_job(
+                run,
+                trigger='date',
+                run_date=datetime.now(),
+                id=f'manual-{name}',
+                name=f'Manual {name} run',
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=None,
+                replace_existing=True,
+            )
+        else:
+            threading.Thread(target=run, name=f'run-now-{name}', daemon=True).start()
+    except Exception:
+        in_flight.clear()
+        raise
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ymd(value):
+    """Memoized ``strptime(value, '%Y-%m-%d').date()``; config saves reuse a handful of dates."""
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _request_json(silent=False):
+    """``request.get_json()``, decoded with orjson when it is installed.
+
+    Anything orjson can't decode is handed back to Flask so the caller sees
+    the same 400/415 errors as before (or ``None`` when ``silent``).
+    """
+    if orjson is None or not request.is_json:
+        return request.get_json(silent=silent)
+    try:
+        return orjson.loads(request.get_data(cache=True))
+    except orjson.JSONDecodeError:
+        return request.get_json(silent=silent)
+
 
 # =============================================================================
 # Pages
@@ -67,14 +216,14 @@ def api_getcomics_search():
 
     query = request.args.get('q', '')
     if not query:
-        return jsonify({"success": False, "error": "Query required"}), 400
+        return _json_response({"success": False, "error": "Query required"}, 400)
 
     try:
         results = search_getcomics(query)
-        return jsonify({"success": True, "results": results})
+        return _json_response({"success": True, "results": results})
     except Exception as e:
-        app_logger.error(f"Error searching getcomics: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Error searching getcomics: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/getcomics/download', methods=['POST'])
@@ -85,12 +234,12 @@ def api_getcomics_download():
     from api import download_queue, download_progress
     from core.config import config
 
-    data = request.get_json() or {}
+    data = _request_json() or {}
     page_url = data.get('url')
     filename = data.get('filename', 'comic.cbz')
 
     if not page_url:
-        return jsonify({"success": False, "error": "URL required"}), 400
+        return _json_response({"success": False, "error": "URL required"}, 400)
 
     try:
         links = get_download_links(page_url)
@@ -101,10 +250,10 @@ def api_getcomics_download():
         (primary_provider, download_url), fallback_urls = select_download_url(links, priority_str)
 
         if not download_url:
-            return jsonify({"success": False, "error": "No download link found"}), 404
+            return _json_response({"success": False, "error": "No download link found"}, 404)
 
         # Queue download using existing system
-        download_id = str(uuid.uuid4())
+        download_id = secrets.token_hex(16)
         download_progress[download_id] = {
             'url': download_url,
             'progress': 0,
@@ -134,10 +283,10 @@ def api_getcomics_download():
         }
         download_queue.put(task)
 
-        return jsonify({"success": True, "download_id": download_id})
+        return _json_response({"success": True, "download_id": download_id})
     except Exception as e:
-        app_logger.error(f"Error downloading from getcomics: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Error downloading from getcomics: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/getcomics/download-status/<download_id>', methods=['GET'])
@@ -151,9 +300,9 @@ def api_getcomics_download_status(download_id):
 
     progress = download_progress.get(download_id)
     if progress is None:
-        return jsonify({"success": False, "error": "Unknown download"}), 404
+        return _json_response({"success": False, "error": "Unknown download"}, 404)
 
-    return jsonify({
+    return _json_response({
         "success": True,
         "download_id": download_id,
         "status": progress.get("status"),
@@ -387,7 +536,7 @@ def api_getcomics_simulate():
 
     Optionally filter to specific series or limit the number of series simulated.
     """
-    data = request.get_json() or {}
+    data = _request_json() or {}
     series_id = data.get('series_id')  # optional: simulate single series
     limit = data.get('limit', 10)      # max series to simulate (safety limit)
 
@@ -399,14 +548,14 @@ def api_getcomics_simulate():
             if series:
                 target_series_name = series.get("name")
             else:
-                return jsonify({"success": False, "error": "Series not found"}), 404
+                return _json_response({"success": False, "error": "Series not found"}, 404)
 
         # Run the simulation inline (avoids importing app.py which has @app.template_filter
         # that can't be registered after first request)
         all_results = _run_wanted_simulation(limit, series_id, target_series_name)
 
         if all_results is None:
-            return jsonify({"success": False, "error": "Simulation failed"}), 500
+            return _json_response({"success": False, "error": "Simulation failed"}, 500)
 
         # Filter to target series if specified
         if target_series_name:
@@ -427,7 +576,7 @@ def api_getcomics_simulate():
         no_match_count = sum(1 for r in all_results if not r.get('best_accept') and not r.get('best_fallback'))
         no_results_count = sum(1 for r in all_results if r.get('status') == 'no_results')
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "simulation": limited_results,
             "summary": {
@@ -443,9 +592,9 @@ def api_getcomics_simulate():
         })
     except Exception as e:
         import traceback
-        app_logger.error(f"Simulation error: {e}")
-        app_logger.error(f"Simulation traceback: {traceback.format_exc()}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Simulation error: %s", e)
+        app_logger.error("Simulation traceback: %s", traceback.format_exc())
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 # =============================================================================
@@ -460,7 +609,7 @@ def api_get_sync_schedule():
 
         schedule = get_sync_schedule()
         if not schedule:
-            return jsonify({
+            return _json_response({
                 "success": True,
                 "schedule": {
                     "frequency": "disabled",
@@ -473,7 +622,7 @@ def api_get_sync_schedule():
 
         from app import get_next_run_for_job
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "schedule": {
                 "frequency": schedule['frequency'],
@@ -484,41 +633,45 @@ def api_get_sync_schedule():
             "last_sync": schedule.get('last_sync')
         })
     except Exception as e:
-        app_logger.error(f"Failed to get sync schedule: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to get sync schedule: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 @downloads_bp.route('/api/save-sync-schedule', methods=['POST'])
 def api_save_sync_schedule():
     """Save the series sync schedule configuration."""
+    if (request.content_length or 0) > _MAX_SETTINGS_BODY:
+        return _json_response({"success": False, "error": "Payload too large"}, 413)
     try:
         from core.database import save_sync_schedule as db_save_sync_schedule
         from app import configure_sync_schedule
 
-        data = request.get_json()
+        data = _request_json(silent=True)
+        if not isinstance(data, dict):
+            return _json_response({"success": False, "error": "Invalid JSON body"}, 400)
         frequency = data.get('frequency', 'disabled')
         time_str = data.get('time', '03:00')
         weekday = int(data.get('weekday', 0))
 
         # Validate inputs
         if frequency not in ['disabled', 'daily', 'weekly']:
-            return jsonify({"success": False, "error": "Invalid frequency"}), 400
+            return _json_response({"success": False, "error": "Invalid frequency"}, 400)
 
         # Save to database
         if not db_save_sync_schedule(frequency, time_str, weekday):
-            return jsonify({"success": False, "error": "Failed to save schedule to database"}), 500
+            return _json_response({"success": False, "error": "Failed to save schedule to database"}, 500)
 
         # Reconfigure the scheduler
         configure_sync_schedule()
 
-        app_logger.info(f"Sync schedule saved: {frequency} at {time_str}")
+        app_logger.info("Sync schedule saved: %s at %s", frequency, time_str)
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "message": f"Sync schedule saved successfully: {frequency} at {time_str}"
         })
     except Exception as e:
-        app_logger.error(f"Failed to save sync schedule: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to save sync schedule: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 # =============================================================================
@@ -533,20 +686,11 @@ def api_get_getcomics_schedule():
 
         schedule = get_getcomics_schedule()
         if not schedule:
-            return jsonify({
-                "success": True,
-                "schedule": {
-                    "frequency": "disabled",
-                    "time": "03:00",
-                    "weekday": 0
-                },
-                "next_run": "Not scheduled",
-                "last_run": None
-            })
+            return _constant_response(_GETCOMICS_SCHEDULE_UNSET)
 
         from app import get_next_run_for_job
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "schedule": {
                 "frequency": schedule['frequency'],
@@ -557,50 +701,50 @@ def api_get_getcomics_schedule():
             "last_run": schedule.get('last_run')
         })
     except Exception as e:
-        app_logger.error(f"Failed to get getcomics schedule: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to get getcomics schedule: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/save-getcomics-schedule', methods=['POST'])
 def api_save_getcomics_schedule():
     """Save the GetComics auto-download schedule configuration."""
+    if (request.content_length or 0) > _MAX_SETTINGS_BODY:
+        return _json_response({"success": False, "error": "Payload too large"}, 413)
     try:
         from core.database import save_getcomics_schedule
         from app import configure_getcomics_schedule
 
-        data = request.get_json()
+        data = _request_json(silent=True)
+        if not isinstance(data, dict):
+            return _json_response({"success": False, "error": "Invalid JSON body"}, 400)
         frequency = data.get('frequency', 'disabled')
         time_str = data.get('time', '03:00')
         weekday = int(data.get('weekday', 0))
 
         # Validate frequency
         if frequency not in ['disabled', 'daily', 'weekly']:
-            return jsonify({"success": False, "error": "Invalid frequency"}), 400
+            return _json_response({"success": False, "error": "Invalid frequency"}, 400)
 
         # Validate time format
-        try:
-            parts = time_str.split(':')
-            if len(parts) != 2 or not (0 <= int(parts[0]) <= 23) or not (0 <= int(parts[1]) <= 59):
-                raise ValueError("Invalid time format")
-        except Exception:
-            return jsonify({"success": False, "error": "Invalid time format. Use HH:MM"}), 400
+        if not isinstance(time_str, str) or not _TIME_RE.fullmatch(time_str):
+            return _json_response({"success": False, "error": "Invalid time format. Use HH:MM"}, 400)
 
         # Save to database
         if not save_getcomics_schedule(frequency, time_str, weekday):
-            return jsonify({"success": False, "error": "Failed to save schedule to database"}), 500
+            return _json_response({"success": False, "error": "Failed to save schedule to database"}, 500)
 
         # Reconfigure the scheduler
         configure_getcomics_schedule()
 
-        app_logger.info(f"GetComics schedule saved: {frequency} at {time_str}")
+        app_logger.info("GetComics schedule saved: %s at %s", frequency, time_str)
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "message": f"Schedule saved: {frequency} at {time_str}"
         })
     except Exception as e:
-        app_logger.error(f"Failed to save getcomics schedule: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to save getcomics schedule: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/run-getcomics-now', methods=['POST'])
@@ -609,15 +753,19 @@ def api_run_getcomics_now():
     try:
         from app import scheduled_getcomics_download
 
-        # Run in a background thread to not block the request
-        threading.Thread(target=scheduled_getcomics_download, daemon=True).start()
-        return jsonify({
+        # Run in the background to not block the request
+        if not _submit_run_now('getcomics', scheduled_getcomics_download):
+            return _json_response({
+                "success": True,
+                "message": "GetComics auto-download is already running"
+            })
+        return _json_response({
             "success": True,
             "message": "GetComics auto-download started in background"
         })
     except Exception as e:
-        app_logger.error(f"Failed to start getcomics download: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to start getcomics download: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 # =============================================================================
@@ -632,27 +780,12 @@ def api_get_weekly_packs_config():
 
         config = get_weekly_packs_config()
         if not config:
-            return jsonify({
-                "success": True,
-                "config": {
-                    "enabled": False,
-                    "format": "JPG",
-                    "publishers": [],
-                    "weekday": 2,
-                    "time": "10:00",
-                    "retry_enabled": True,
-                    "start_date": None
-                },
-                "next_run": "Not scheduled",
-                "last_run": None,
-                "last_successful_pack": None,
-                "start_date": None
-            })
+            return _constant_response(_WEEKLY_PACKS_CONFIG_UNSET)
 
         from app import get_next_run_for_job
         next_run = get_next_run_for_job('weekly_packs_download')
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "config": {
                 "enabled": config['enabled'],
@@ -669,18 +802,22 @@ def api_get_weekly_packs_config():
             "start_date": config.get('start_date')
         })
     except Exception as e:
-        app_logger.error(f"Failed to get weekly packs config: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to get weekly packs config: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/save-weekly-packs-config', methods=['POST'])
 def api_save_weekly_packs_config():
     """Save the Weekly Packs configuration."""
+    if (request.content_length or 0) > _MAX_SETTINGS_BODY:
+        return _json_response({"success": False, "error": "Payload too large"}, 413)
     try:
         from core.database import save_weekly_packs_config
         from app import configure_weekly_packs_schedule
 
-        data = request.get_json()
+        data = _request_json(silent=True)
+        if not isinstance(data, dict):
+            return _json_response({"success": False, "error": "Invalid JSON body"}, 400)
         enabled = bool(data.get('enabled', False))
         format_pref = data.get('format', 'JPG')
         publishers = data.get('publishers', [])
@@ -692,53 +829,48 @@ def api_save_weekly_packs_config():
         # Validate start_date if provided
         if start_date:
             try:
-                parsed_date = datetime.strptime(start_date, '%Y-%m-%d')
+                parsed_day = _parse_ymd(start_date).toordinal()
                 # Validate it's within 6 months back to current
-                now = datetime.now()
-                six_months_ago = now - timedelta(days=180)
-                if parsed_date < six_months_ago or parsed_date > now:
-                    return jsonify({"success": False, "error": "Start date must be within the last 6 months"}), 400
+                today = date.today().toordinal()
+                if not (today - 180 <= parsed_day <= today):
+                    return _json_response({"success": False, "error": "Start date must be within the last 6 months"}, 400)
             except ValueError:
-                return jsonify({"success": False, "error": "Invalid start_date format. Use YYYY-MM-DD"}), 400
+                return _json_response({"success": False, "error": "Invalid start_date format. Use YYYY-MM-DD"}, 400)
 
         # Validate format
         if format_pref not in ['JPG', 'WEBP']:
-            return jsonify({"success": False, "error": "Invalid format. Use JPG or WEBP"}), 400
+            return _json_response({"success": False, "error": "Invalid format. Use JPG or WEBP"}, 400)
 
         # Validate publishers
-        valid_publishers = ['DC', 'Marvel', 'Image', 'INDIE']
-        if not all(p in valid_publishers for p in publishers):
-            return jsonify({"success": False, "error": f"Invalid publisher. Use: {valid_publishers}"}), 400
+        if (not isinstance(publishers, list)
+                or not all(isinstance(p, str) for p in publishers)
+                or not _VALID_PUBLISHERS.issuperset(publishers)):
+            return _json_response({"success": False, "error": f"Invalid publisher. Use: {list(_WEEKLY_PACK_PUBLISHERS)}"}, 400)
 
         # Validate time format
-        try:
-            parts = time_str.split(':')
-            if len(parts) != 2 or not (0 <= int(parts[0]) <= 23) or not (0 <= int(parts[1]) <= 59):
-                raise ValueError("Invalid time format")
-        except Exception:
-            return jsonify({"success": False, "error": "Invalid time format. Use HH:MM"}), 400
+        if not isinstance(time_str, str) or not _TIME_RE.fullmatch(time_str):
+            return _json_response({"success": False, "error": "Invalid time format. Use HH:MM"}, 400)
 
         # Validate weekday
         if not (0 <= weekday <= 6):
-            return jsonify({"success": False, "error": "Invalid weekday. Use 0-6 (Mon-Sun)"}), 400
+            return _json_response({"success": False, "error": "Invalid weekday. Use 0-6 (Mon-Sun)"}, 400)
 
         # Save to database
         if not save_weekly_packs_config(enabled, format_pref, publishers, weekday, time_str, retry_enabled, start_date):
-            return jsonify({"success": False, "error": "Failed to save config to database"}), 500
+            return _json_response({"success": False, "error": "Failed to save config to database"}, 500)
 
         # Reconfigure the scheduler
         configure_weekly_packs_schedule()
 
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        app_logger.info(f"Weekly packs config saved: enabled={enabled}, {format_pref}, {publishers}, {days[weekday]} at {time_str}")
+        app_logger.info("Weekly packs config saved: enabled=%s, %s, %s, %s at %s", enabled, format_pref, publishers, _DAYS[weekday], time_str)
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "message": f"Weekly packs config saved"
         })
     except Exception as e:
-        app_logger.error(f"Failed to save weekly packs config: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to save weekly packs config: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/run-weekly-packs-now', methods=['POST'])
@@ -747,15 +879,19 @@ def api_run_weekly_packs_now():
     try:
         from app import scheduled_weekly_packs_download
 
-        # Run in a background thread to not block the request
-        threading.Thread(target=scheduled_weekly_packs_download, daemon=True).start()
-        return jsonify({
+        # Run in the background to not block the request
+        if not _submit_run_now('weekly_packs', scheduled_weekly_packs_download):
+            return _json_response({
+                "success": True,
+                "message": "Weekly packs download check is already running"
+            })
+        return _json_response({
             "success": True,
             "message": "Weekly packs download check started in background"
         })
     except Exception as e:
-        app_logger.error(f"Failed to start weekly packs download: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to start weekly packs download: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/weekly-packs-history', methods=['GET'])
@@ -764,16 +900,22 @@ def api_weekly_packs_history():
     try:
         from core.database import get_weekly_packs_history
 
-        limit = request.args.get('limit', 20, type=int)
+        raw_limit = request.args.get('limit')
+        try:
+            limit = int(raw_limit) if raw_limit else 20
+        except ValueError:
+            limit = 20
+        # Clamped so one request can't ask for the whole table (or a negative LIMIT)
+        limit = min(max(limit, 1), 200)
         history = get_weekly_packs_history(limit)
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "history": history
         })
     except Exception as e:
-        app_logger.error(f"Failed to get weekly packs history: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to get weekly packs history: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
 
 
 @downloads_bp.route('/api/check-weekly-pack-status', methods=['GET'])
@@ -784,7 +926,7 @@ def api_check_weekly_pack_status():
 
         pack_url, pack_date = find_latest_weekly_pack_url()
         if not pack_url:
-            return jsonify({
+            return _json_response({
                 "success": True,
                 "found": False,
                 "message": "Could not find weekly pack on homepage"
@@ -792,7 +934,7 @@ def api_check_weekly_pack_status():
 
         available = check_weekly_pack_availability(pack_url)
 
-        return jsonify({
+        return _json_response({
             "success": True,
             "found": True,
             "pack_date": pack_date,
@@ -801,5 +943,5 @@ def api_check_weekly_pack_status():
             "message": "Links available" if available else "Links not ready yet"
         })
     except Exception as e:
-        app_logger.error(f"Failed to check weekly pack status: {e}")
-        return jsonify({"success": False, "error": str(e)}), 500
+        app_logger.error("Failed to check weekly pack status: %s", e)
+        return _json_response({"success": False, "error": str(e)}, 500)
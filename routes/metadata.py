@@ -12,7 +12,9 @@ Provides routes for:
 
 import os
 import re
+import functools
 import io
+import itertools
 import json
 import time
 import shutil
@@ -24,6 +26,12 @@ import sqlite3
 from datetime import datetime
 from flask import (Blueprint, request, jsonify, Response,
                    stream_with_context, current_app)
+
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
 import core.app_state as app_state
 from core.app_logging import app_logger
 from core.config import config
@@ -53,9 +61,19 @@ except (ValueError, TypeError):
 def _as_text(val):
     if val is None:
         return None
+    if isinstance(val, str):
+        return val
     if isinstance(val, (list, tuple, set)):
-        # ComicInfo expects comma-separated for multi-credits
-        return ", ".join(str(x) for x in val if x is not None and str(x).strip())
+        # ComicInfo expects comma-separated for multi-credits; skip None and
+        # blank entries, and only stringify the items that aren't already str.
+        parts = []
+        for x in val:
+            if x is None:
+                continue
+            text = x if isinstance(x, str) else str(x)
+            if text.strip():
+                parts.append(text)
+        return ", ".join(parts)
     return str(val)
 
 
@@ -98,89 +116,99 @@ def extract_series_name_from_filename(filename):
     return s.strip()
 
 
-def generate_comicinfo_xml(issue_data, series_data=None):
-    """
-    Generate a ComicInfo.xml that ComicRack will actually read.
-    - No XML namespaces
-    - UTF-8 bytes with XML declaration
-    - Only write elements when we have non-empty values
-    - Ensure numeric fields are integers-as-text
-    """
-    root = ET.Element("ComicInfo")  # IMPORTANT: no xmlns/xsi attributes
+def _issue_number_text(value):
+    num_str = str(value).strip()
+    if num_str.replace(".", "", 1).isdigit():
+        if "." in num_str:
+            # Decimal issue: strip trailing .0, but preserve original formatting (e.g. "012.1")
+            num_val = float(num_str)
+            if num_val == int(num_val):
+                return str(int(num_val))
+            return num_str
+        # Whole number: convert to int to strip leading zeros
+        return str(int(num_str))
+    return num_str
 
-    def add(tag, value):
-        val = _as_text(value)
-        if val:
-            ET.SubElement(root, tag).text = val
 
-    # Basic
-    add("Title",   issue_data.get("Title"))
-    add("Series",  issue_data.get("Series"))
-    # Number/Count/Volume should be simple numerics-as-text
-    if issue_data.get("Number") not in (None, ""):
-        num_str = str(issue_data["Number"]).strip()
-        if num_str.replace(".", "", 1).isdigit():
-            if "." in num_str:
-                # Decimal issue: strip trailing .0, but preserve original formatting (e.g. "012.1")
-                num_val = float(num_str)
-                if num_val == int(num_val):
-                    add("Number", str(int(num_val)))
-                else:
-                    add("Number", num_str)
-            else:
-                # Whole number: convert to int to strip leading zeros
-                add("Number", str(int(num_str)))
-        else:
-            add("Number", num_str)
-    if issue_data.get("Count") not in (None, ""):
-        add("Count", str(int(issue_data["Count"])) )
-    if issue_data.get("Volume") not in (None, ""):
-        add("Volume", str(int(issue_data["Volume"])) )
+def _int_text(value):
+    return str(int(value))
 
-    add("Summary", issue_data.get("Summary"))
 
-    # Dates
-    if issue_data.get("Year") not in (None, ""):
-        add("Year", str(int(issue_data["Year"])))
-    if issue_data.get("Month") not in (None, ""):
-        m = int(issue_data["Month"])
-        if 1 <= m <= 12:
-            add("Month", str(m))
+def _month_text(value):
+    m = int(value)
+    return str(m) if 1 <= m <= 12 else None
 
-    # Credits
-    add("Writer",      issue_data.get("Writer"))
-    add("Penciller",   issue_data.get("Penciller"))
-    add("Inker",       issue_data.get("Inker"))
-    add("Colorist",    issue_data.get("Colorist"))
-    add("Letterer",    issue_data.get("Letterer"))
-    add("CoverArtist", issue_data.get("CoverArtist"))
 
-    # Publisher/Imprint
-    add("Publisher", issue_data.get("Publisher"))
+def _page_count_text(value):
+    return str(int(float(value)))
 
-    # Genre/Characters/Teams/Locations
-    add("Genre",      issue_data.get("Genre"))
-    add("Characters", issue_data.get("Characters"))
-    add("Teams",      issue_data.get("Teams"))
-    add("Locations",  issue_data.get("Locations"))
-    add("StoryArc",   issue_data.get("StoryArc"))
-    add("AlternateSeries", issue_data.get("AlternateSeries"))
 
+# ComicInfo elements in the order they are written: (tag, to_text, default).
+# A field with a default is written as ``value or default``; the others are
+# skipped when missing or empty. Notes is handled separately (it needs the id).
+_COMICINFO_FIELDS = (
+    # Basic
+    ("Title", _as_text, None),
+    ("Series", _as_text, None),
+    # Number/Count/Volume should be simple numerics-as-text
+    ("Number", _issue_number_text, None),
+    ("Count", _int_text, None),
+    ("Volume", _int_text, None),
+    ("Summary", _as_text, None),
+    # Dates
+    ("Year", _int_text, None),
+    ("Month", _month_text, None),
+    # Credits
+    ("Writer", _as_text, None),
+    ("Penciller", _as_text, None),
+    ("Inker", _as_text, None),
+    ("Colorist", _as_text, None),
+    ("Letterer", _as_text, None),
+    ("CoverArtist", _as_text, None),
+    # Publisher/Imprint
+    ("Publisher", _as_text, None),
+    # Genre/Characters/Teams/Locations
+    ("Genre", _as_text, None),
+    ("Characters", _as_text, None),
+    ("Teams", _as_text, None),
+    ("Locations", _as_text, None),
+    ("StoryArc", _as_text, None),
+    ("AlternateSeries", _as_text, None),
     # Language (ComicRack likes LanguageISO, e.g., 'en')
-    add("LanguageISO", issue_data.get("LanguageISO") or "en")
-
+    ("LanguageISO", _as_text, "en"),
     # Page count (integer)
-    if issue_data.get("PageCount") not in (None, ""):
-        add("PageCount", str(int(float(issue_data["PageCount"]))))
-
+    ("PageCount", _page_count_text, None),
     # Manga flag: ComicRack expects "Yes", "No", or "YesAndRightToLeft"
-    add("Manga", issue_data.get("Manga") or "No")
-
+    ("Manga", _as_text, "No"),
     # Web link
-    add("Web", issue_data.get("Web"))
-
+    ("Web", _as_text, None),
     # Metron ID (for scrobble support)
-    add("MetronId", issue_data.get("MetronId"))
+    ("MetronId", _as_text, None),
+)
+
+
+def generate_comicinfo_xml(issue_data, series_data=None):
+    """
+    Generate a ComicInfo.xml that ComicRack will actually read.
+    - No XML namespaces
+    - UTF-8 bytes with XML declaration
+    - Only write elements when we have non-empty values
+    - Ensure numeric fields are integers-as-text
+    """
+    fields = []
+
+    def add(tag, value):
+        val = _as_text(value)
+        if val:
+            fields.append((tag, val))
+
+    for tag, to_text, default in _COMICINFO_FIELDS:
+        value = issue_data.get(tag)
+        if default is not None:
+            value = value or default
+        elif value is None or value == "":
+            continue
+        add(tag, to_text(value))
 
     # Notes - use provided Notes if available (e.g., from ComicVine), otherwise generate GCD notes
     if issue_data.get("Notes"):
@@ -190,7 +218,31 @@ def generate_comicinfo_xml(issue_data, series_data=None):
         notes = f"Metadata from Grand Comic Database (GCD). Issue ID: {issue_data.get('id', 'Unknown')} — retrieved {datetime.now():%Y-%m-%d}."
         add("Notes", notes)
 
-    # Pretty-print and serialize as UTF-8 BYTES (not a Python str)
+    return _serialize_comicinfo(tuple(fields))
+
+
+@functools.lru_cache(maxsize=256)
+def _serialize_comicinfo(fields):
+    """Serialize ``(tag, text)`` pairs as an indented ComicInfo document.
+
+    Returns UTF-8 BYTES (not a Python str). lxml does this in C when it is
+    installed; its output is byte-identical to the ElementTree fallback.
+    Memoized on the final field values, so re-tagging the same issues in a
+    batch (or retrying one) skips rebuilding the tree.
+    """
+    if LET is not None:
+        try:
+            root = LET.Element("ComicInfo")  # IMPORTANT: no xmlns/xsi attributes
+            for tag, text in fields:
+                LET.SubElement(root, tag).text = text
+            xml_bytes = LET.tostring(root, encoding="utf-8", xml_declaration=True, pretty_print=True)
+            return xml_bytes.rstrip(b"\n")  # ElementTree writes no trailing newline
+        except ValueError:
+            pass  # lxml refuses control characters; ElementTree writes them as-is
+
+    root = ET.Element("ComicInfo")  # IMPORTANT: no xmlns/xsi attributes
+    for tag, text in fields:
+        ET.SubElement(root, tag).text = text
     ET.indent(root)  # Python 3.9+
     tree = ET.ElementTree(root)
     buf = io.BytesIO()
@@ -420,7 +472,7 @@ def _remove_comicinfo_from_cbz(file_path):
         return {"success": False, "error": "File is not a CBZ"}
 
     try:
-        from helpers import open_zip_for_write
+        from helpers import open_zip_for_write, copy_zip_member_raw
 
         # Bail out before rewriting if there's nothing to remove.
         with zipfile.ZipFile(file_path, 'r') as z:
@@ -437,7 +489,8 @@ def _remove_comicinfo_from_cbz(file_path):
                 for item in old_zip.infolist():
                     if os.path.basename(item.filename).lower() == "comicinfo.xml":
                         continue
-                    new_zip.writestr(item, old_zip.read(item.filename))
+                    # Pages are unchanged, so copy their compressed bytes as-is.
+                    copy_zip_member_raw(old_zip, new_zip, item)
 
         from core.database import set_has_comicinfo
         set_has_comicinfo(file_path, 0)
@@ -483,11 +536,11 @@ def cbz_bulk_clear_comicinfo():
             if f.lower().endswith('.cbz')
         ]
 
-    # Filter to valid existing CBZ files
-    cbz_files = [
+    # Filter to valid existing CBZ files (once each — they're rewritten in parallel)
+    cbz_files = list(dict.fromkeys(
         p for p in paths
         if p.lower().endswith('.cbz') and os.path.isfile(p)
-    ]
+    ))
 
     if not cbz_files:
         return jsonify({"success": False, "error": "No CBZ files found"}), 400
@@ -497,9 +550,29 @@ def cbz_bulk_clear_comicinfo():
     op_id = app_state.register_operation("metadata", f"Remove XML: {label}", total=total)
 
     def process_files():
-        for i, file_path in enumerate(cbz_files, 1):
-            _remove_comicinfo_from_cbz(file_path)
-            app_state.update_operation(op_id, current=i, detail=os.path.basename(file_path))
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        # Pages are copied without recompression, so each rewrite is mostly
+        # disk I/O; a few threads overlap it without thrashing the disk.
+        workers = min(4, os.cpu_count() or 1, total)
+        remaining = iter(cbz_files)
+        done_count = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Keep only a small window of futures alive: progress goes to the
+            # operation as each file finishes and its result is dropped, so a
+            # folder of thousands of CBZs never holds thousands of results.
+            pending = {}
+            for file_path in itertools.islice(remaining, workers * 2):
+                pending[executor.submit(_remove_comicinfo_from_cbz, file_path)] = file_path
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    file_path = pending.pop(future)
+                    done_count += 1
+                    app_state.update_operation(op_id, current=done_count, detail=os.path.basename(file_path))
+                    next_path = next(remaining, None)
+                    if next_path is not None:
+                        pending[executor.submit(_remove_comicinfo_from_cbz, next_path)] = next_path
         app_state.complete_operation(op_id)
 
     threading.Thread(target=process_files, daemon=True).start()
@@ -41,13 +41,25 @@ def _ensure_fake_module(name, attrs=None):
     return sys.modules[name]
 
 
+class _StubScheduler:
+    """Stand-in BackgroundScheduler: every method is a no-op returning None."""
+
+    running = False
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
 try:
     import apscheduler  # noqa: F401
 except ImportError:
     _ensure_fake_module("apscheduler")
     _ensure_fake_module("apscheduler.schedulers")
     _ensure_fake_module("apscheduler.schedulers.background",
-                        {"BackgroundScheduler": _MM})
+                        {"BackgroundScheduler": _StubScheduler})
     _ensure_fake_module("apscheduler.triggers")
     _ensure_fake_module("apscheduler.triggers.cron", {"CronTrigger": _MM})
     _ensure_fake_module("apscheduler.triggers.date", {"DateTrigger": _MM})
@@ -119,16 +131,34 @@ def db_path(tmp_path):
     return str(tmp_path / "test_comic_utils.db")
 
 
+@pytest.fixture(scope="session")
+def db_template(tmp_path_factory):
+    """
+    Schema-only database built once per session by init_db().
+    Tests get a copy of it rather than re-running the DDL.
+    """
+    from tests.factories.db_factories import use_test_db
+
+    path = str(tmp_path_factory.mktemp("db_template") / "template.db")
+    with use_test_db(path):
+        from core.database import init_db
+
+        init_db()
+    return path
+
+
 @pytest.fixture
-def db_connection(db_path):
+def db_connection(db_path, db_template):
     """
     Create a fresh SQLite database with the full CLU schema.
     Patches get_db_path() so all database.py functions use this test DB.
     """
-    with patch("core.database.get_db_path", return_value=db_path):
-        from core.database import init_db, get_db_connection
+    from tests.factories.db_factories import restore_db, use_test_db
+
+    restore_db(db_template, db_path)
+    with use_test_db(db_path):
+        from core.database import get_db_connection
 
-        init_db()
         conn = get_db_connection()
         yield conn
         conn.close()
@@ -162,6 +192,29 @@ def create_cbz(tmp_path):
     return _create_cbz
 
 
+# ---------------------------------------------------------------------------
+# Fixture: Library cache reset (autouse)
+# ---------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def _reset_libraries_cache():
+    """Each test gets its own database, so never serve another test's libraries."""
+    from helpers.library import invalidate_libraries_cache
+
+    invalidate_libraries_cache()
+    yield
+    invalidate_libraries_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_schedule_cache():
+    """Same for cached schedule and weekly packs config rows."""
+    from core.database import invalidate_schedule_cache
+
+    invalidate_schedule_cache()
+    yield
+    invalidate_schedule_cache()
+
+
 # ---------------------------------------------------------------------------
 # Fixture: Logging suppression (autouse)
 # ---------------------------------------------------------------------------
@@ -5,23 +5,29 @@ These call actual database.py CRUD functions with sensible defaults,
 so they validate the same code paths as production.  Every factory
 returns the ID / primary key of the created record when possible.
 """
+import sqlite3
 import time
+from contextlib import contextmanager
+from unittest.mock import patch
 
 
 # ---------------------------------------------------------------------------
 # Counters for unique defaults
 # ---------------------------------------------------------------------------
-_counters = {}
+# One slot per factory, allocated once; reset_counters() zeroes them in place.
+_COUNTERS = dict.fromkeys(
+    ("file", "dir", "pub", "series", "issue", "read", "pos", "rlist", "pref", "lib"), 0
+)
 
 
-def _next(prefix="item"):
-    _counters.setdefault(prefix, 0)
-    _counters[prefix] += 1
-    return _counters[prefix]
+def _next(prefix):
+    _COUNTERS[prefix] += 1
+    return _COUNTERS[prefix]
 
 
 def reset_counters():
-    _counters.clear()
+    for key in _COUNTERS:
+        _COUNTERS[key] = 0
 
 
 # ---------------------------------------------------------------------------
@@ -306,3 +312,41 @@ def create_library(name=None, path=None):
     library_id = add_library(name=name, path=path)
     assert library_id is not None, f"create_library failed for {name}"
     return library_id
+
+
+# ---------------------------------------------------------------------------
+# Test databases
+# ---------------------------------------------------------------------------
+@contextmanager
+def use_test_db(db_path):
+    """
+    Point core.database at ``db_path`` for the duration of the block.
+
+    Connections handed out by get_db_connection() skip fsync on commit;
+    test databases are thrown away, so durability buys nothing.
+    """
+    import core.database as database
+
+    connect = database.get_db_connection
+
+    def fast_connect():
+        conn = connect()
+        if conn is not None:
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    with patch.object(database, "get_db_path", return_value=db_path), \
+            patch.object(database, "get_db_connection", fast_connect):
+        yield
+
+
+def restore_db(template_path, dest_path):
+    """Copy the database at ``template_path`` into ``dest_path`` page by page."""
+    src = sqlite3.connect(template_path)
+    dst = sqlite3.connect(dest_path)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
@@ -52,6 +52,24 @@ class TestMarkIssueRead:
         assert reads[0]["page_count"] == 30
         assert reads[0]["time_spent"] == 900
 
+    def test_mark_bulk(self, db_connection):
+        from core.database import mark_issues_read_bulk, is_issue_read, get_issue_read_date
+
+        ok = mark_issues_read_bulk([
+            {"issue_path": "/data/C1.cbz", "read_at": "2024-06-15T10:00:00", "page_count": 24},
+            {"issue_path": "/data/C2.cbz"},
+        ])
+        assert ok is True
+        assert is_issue_read("/data/C1.cbz") is True
+        assert is_issue_read("/data/C2.cbz") is True
+        assert "2024-06-15" in get_issue_read_date("/data/C1.cbz")
+        assert get_issue_read_date("/data/C2.cbz") is not None
+
+    def test_mark_bulk_empty(self, db_connection):
+        from core.database import mark_issues_read_bulk
+
+        assert mark_issues_read_bulk([]) is True
+
 
 class TestHideIssueFromHistory:
 
@@ -1,6 +1,7 @@
 """Tests for schedules, weekly packs, browse cache, user preferences, reading lists."""
 import pytest
 import json
+from unittest.mock import patch
 from tests.factories.db_factories import create_reading_list, create_reading_list_entry, create_user_preference
 
 
@@ -37,6 +38,101 @@ class TestUnifiedSchedules:
             assert sched is not None, f"Schedule '{name}' not found"
 
 
+class TestScheduleCache:
+
+    def test_repeat_reads_skip_the_database(self, db_connection):
+        from core import database
+        from core.database import get_schedule, get_weekly_packs_config
+
+        get_schedule("getcomics")
+        get_weekly_packs_config()
+        with patch.object(database, "get_db_connection", side_effect=AssertionError("db hit")):
+            assert get_schedule("getcomics") is not None
+            assert get_weekly_packs_config() is not None
+
+    def test_callers_get_independent_copies(self, db_connection):
+        from core.database import get_sync_schedule, get_schedule, get_weekly_packs_config
+
+        get_sync_schedule()  # pops last_run from its copy
+        assert "last_run" in get_schedule("sync")
+
+        get_weekly_packs_config()["publishers"].append("DC")
+        assert get_weekly_packs_config()["publishers"] == []
+
+    def test_save_invalidates(self, db_connection):
+        from core.database import get_getcomics_schedule, save_getcomics_schedule
+
+        get_getcomics_schedule()
+        save_getcomics_schedule("weekly", "05:30", weekday=4)
+        sched = get_getcomics_schedule()
+        assert (sched["frequency"], sched["time"], sched["weekday"]) == ("weekly", "05:30", 4)
+
+    def test_last_run_update_invalidates(self, db_connection):
+        from core.database import (
+            get_weekly_packs_config,
+            update_last_getcomics_run,
+            get_getcomics_schedule,
+            update_last_weekly_packs_run,
+        )
+
+        assert get_getcomics_schedule()["last_run"] is None
+        update_last_getcomics_run()
+        assert get_getcomics_schedule()["last_run"] is not None
+
+        get_weekly_packs_config()
+        update_last_weekly_packs_run("2024-01-17")
+        config = get_weekly_packs_config()
+        assert config["last_run"] is not None
+        assert config["last_successful_pack"] == "2024-01-17"
+
+    def test_weekly_config_save_invalidates(self, db_connection):
+        from core.database import save_weekly_packs_config, get_weekly_packs_config
+
+        get_weekly_packs_config()
+        save_weekly_packs_config(True, "WEBP", ["Image"], 1, "07:15", False)
+        config = get_weekly_packs_config()
+        assert config["format"] == "WEBP"
+        assert config["publishers"] == ["Image"]
+        assert config["time"] == "07:15"
+
+    def test_history_cached_until_a_pack_is_logged(self, db_connection):
+        from core import database
+        from core.database import (
+            get_weekly_packs_history,
+            log_weekly_pack_download,
+            update_weekly_pack_status,
+        )
+
+        log_weekly_pack_download("2024-01-10", "DC", "JPG", "https://example.com/a")
+        assert len(get_weekly_packs_history(5)) == 1
+        with patch.object(database, "get_db_connection", side_effect=AssertionError("db hit")):
+            history = get_weekly_packs_history(5)
+        history[0]["status"] = "mutated"
+
+        log_weekly_pack_download("2024-01-17", "Marvel", "JPG", "https://example.com/b")
+        assert len(get_weekly_packs_history(5)) == 2
+
+        update_weekly_pack_status("2024-01-10", "DC", "JPG", "completed")
+        statuses = {h["publisher"]: h["status"] for h in get_weekly_packs_history(5)}
+        assert statuses == {"DC": "completed", "Marvel": "queued"}
+
+    def test_read_racing_a_write_is_not_cached(self, db_connection):
+        from core import database
+        from core.database import get_schedule, invalidate_schedule_cache
+
+        real_connect = database.get_db_connection
+
+        def connect_then_write():
+            # Simulate a save landing between this read's SELECT and its store.
+            conn = real_connect()
+            invalidate_schedule_cache()
+            return conn
+
+        with patch.object(database, "get_db_connection", side_effect=connect_then_write):
+            get_schedule("rebuild")
+        assert ("schedule", "rebuild") not in database._schedule_cache
+
+
 class TestLegacySchedules:
 
     def test_get_rebuild_schedule(self, db_connection):
@@ -1,5 +1,6 @@
 """Tests for series/issues -- CRUD, collection status, wanted issues."""
 import pytest
+from unittest.mock import patch
 from tests.factories.db_factories import create_publisher, create_series, create_issue
 
 
@@ -239,6 +240,49 @@ class TestCollectionStatus:
         assert status is not None
         assert len(status) >= 1
 
+    def test_bulk_save_is_one_transaction(self, db_connection):
+        import core.database as database
+        from core.database import save_collection_status_bulk, get_collection_status_for_series
+
+        series_id = create_series(publisher_id=create_publisher())
+        entries = [{
+            "series_id": series_id,
+            "issue_id": create_issue(series_id=series_id, number=str(n)),
+            "issue_number": str(n),
+            "found": 1,
+            "file_path": f"/data/Comic {n:03d}.cbz",
+            "file_mtime": 1234567890.0,
+            "matched_via": "pattern",
+        } for n in range(1, 26)]
+
+        statements = []
+        real_get_conn = database.get_db_connection
+
+        def traced_conn():
+            conn = real_get_conn()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch.object(database, "get_db_connection", side_effect=traced_conn):
+            assert save_collection_status_bulk(entries) is True
+
+        assert statements.count("COMMIT") == 1
+        assert sum(1 for s in statements if s.startswith("BEGIN")) == 1
+        assert len(get_collection_status_for_series(series_id)) == 25
+
+    def test_save_tuples_from_generator(self, db_connection):
+        from core.database import save_collection_status_bulk_tuples, get_collection_status_for_series
+
+        series_id = create_series(publisher_id=create_publisher())
+        issue_ids = [create_issue(series_id=series_id, number=str(n)) for n in range(1, 4)]
+
+        ok = save_collection_status_bulk_tuples(
+            (series_id, issue_id, str(n), 1, f"/data/Comic {n:03d}.cbz", 1234567890.0, "pattern")
+            for n, issue_id in enumerate(issue_ids, 1)
+        )
+        assert ok is True
+        assert len(get_collection_status_for_series(series_id)) == 3
+
     def test_invalidate_for_series(self, db_connection):
         from core.database import (
             save_collection_status_bulk,
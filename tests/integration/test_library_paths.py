@@ -0,0 +1,149 @@
+"""Tests for helpers/library.py path lookups and the enabled-libraries cache."""
+from unittest.mock import patch
+
+import pytest
+
+from tests.factories.db_factories import create_library
+
+
+class TestLibrariesCache:
+
+    def test_second_lookup_skips_database(self, db_connection):
+        from helpers.library import get_library_roots
+
+        create_library(name="Comics", path="/data/comics")
+        assert get_library_roots() == ["/data/comics"]
+
+        with patch("core.database.get_libraries") as mock_get:
+            assert get_library_roots() == ["/data/comics"]
+        mock_get.assert_not_called()
+
+    def test_add_library_invalidates(self, db_connection):
+        from helpers.library import get_library_roots
+
+        create_library(name="A", path="/data/a")
+        assert get_library_roots() == ["/data/a"]
+
+        create_library(name="B", path="/data/b")
+        assert get_library_roots() == ["/data/a", "/data/b"]
+
+    def test_disable_library_invalidates(self, db_connection):
+        from core.database import update_library
+        from helpers.library import is_valid_library_path
+
+        lib_id = create_library(name="A", path="/data/a")
+        assert is_valid_library_path("/data/a/Batman")
+
+        update_library(lib_id, enabled=False)
+        assert not is_valid_library_path("/data/a/Batman")
+
+    def test_delete_library_invalidates(self, db_connection):
+        from core.database import delete_library
+        from helpers.library import get_default_library
+
+        lib_id = create_library(name="A", path="/data/a")
+        assert get_default_library()["id"] == lib_id
+
+        delete_library(lib_id)
+        assert get_default_library() is None
+
+    def test_invalidate_during_reload_discards_result(self, db_connection):
+        from core.database import get_libraries
+        from helpers.library import get_library_roots, invalidate_libraries_cache
+
+        create_library(name="A", path="/data/a")
+
+        def racing_get_libraries(enabled_only=False):
+            rows = get_libraries(enabled_only=enabled_only)
+            invalidate_libraries_cache()
+            return rows
+
+        with patch("core.database.get_libraries", side_effect=racing_get_libraries):
+            assert get_library_roots() == ["/data/a"]
+
+        # The invalidated reload was not stored, so the next lookup reloads
+        with patch("core.database.get_libraries", return_value=[]) as mock_get:
+            get_library_roots()
+        mock_get.assert_called_once()
+
+    def test_returned_library_is_a_copy(self, db_connection):
+        from helpers.library import get_default_library, get_library_for_path
+
+        create_library(name="A", path="/data/a")
+        get_default_library()["path"] = "/elsewhere"
+        get_library_for_path("/data/a")["name"] = "Changed"
+
+        lib = get_library_for_path("/data/a/x.cbz")
+        assert lib["path"] == "/data/a"
+        assert lib["name"] == "A"
+
+
+class TestLibraryPathLookups:
+
+    def test_is_valid_library_path(self, db_connection):
+        from helpers.library import is_valid_library_path
+
+        create_library(name="Comics", path="/data/comics")
+        assert is_valid_library_path("/data/comics")
+        assert is_valid_library_path("/data/comics/DC/Batman/")
+        assert not is_valid_library_path("/data/comics2/Batman")
+        assert not is_valid_library_path("/data")
+        assert not is_valid_library_path("")
+
+    def test_is_valid_library_path_many_libraries(self, db_connection):
+        from helpers.library import is_valid_library_path
+
+        for i in range(20):
+            create_library(name=f"L{i}", path=f"/data/lib{i}")
+        assert is_valid_library_path("/data/lib7/Batman/Batman 001.cbz")
+        assert is_valid_library_path("/data/lib19")
+        assert not is_valid_library_path("/data/lib20/Batman")
+        assert not is_valid_library_path("/data/lib1x")
+
+    def test_get_library_for_path(self, db_connection):
+        from helpers.library import get_library_for_path
+
+        a = create_library(name="A", path="/data/a")
+        b = create_library(name="B", path="/data/b")
+        assert get_library_for_path("/data/a/x.cbz")["id"] == a
+        assert get_library_for_path("/data/b")["id"] == b
+        assert get_library_for_path("/data/c/x.cbz") is None
+
+    def test_get_library_for_path_nested_keeps_name_order(self, db_connection):
+        from helpers.library import get_library_for_path
+
+        outer = create_library(name="A Outer", path="/data")
+        inner = create_library(name="B Inner", path="/data/inner")
+        # Libraries are ordered by name; the first containing library wins.
+        assert get_library_for_path("/data/inner")["id"] == outer
+        assert get_library_for_path("/data/inner/x.cbz")["id"] == outer
+        assert inner
+
+
+class TestIsCriticalPath:
+
+    @pytest.fixture(autouse=True)
+    def _folders(self):
+        with patch("core.config.get_watch_dir", return_value="/downloads/temp"), \
+             patch("core.config.get_target_dir", return_value="/downloads/processed"):
+            yield
+
+    def test_exact_folders(self):
+        from helpers.library import is_critical_path
+        assert is_critical_path("/downloads/temp")
+        assert is_critical_path("/downloads/processed/")
+
+    def test_parent_folders(self):
+        from helpers.library import is_critical_path
+        assert is_critical_path("/downloads")
+        assert is_critical_path("/")
+
+    def test_partial_name_is_not_parent(self):
+        from helpers.library import is_critical_path
+        assert not is_critical_path("/down")
+        assert not is_critical_path("/downloads/tem")
+
+    def test_child_is_not_critical(self):
+        from helpers.library import is_critical_path
+        assert not is_critical_path("/downloads/temp/Batman")
+        assert not is_critical_path("/data/comics")
@@ -177,3 +177,137 @@ class TestCollectionStatusSelfHeal:
         (series_dir / "Some Extra Variant.cbz").write_bytes(b"stub")
         r2 = match_issues_to_collection(str(series_dir), issue_objs, series_obj)
         assert r2["1"]["found"] is True
+
+    def test_comic_named_directory_does_not_force_rescan(self, db_connection, tmp_path):
+        """The scan skips directories, so the self-heal count must too."""
+        from unittest.mock import patch
+        from helpers.collection import match_issues_to_collection
+
+        series_dir = tmp_path / "Batman (2020)"
+        series_dir.mkdir()
+        series_id = create_series(
+            name="Batman", volume=2020, mapped_path=str(series_dir)
+        )
+        create_issue(series_id=series_id, number="1")
+        (series_dir / "Extras.cbz").mkdir()
+
+        issue_objs, series_obj = self._objs(series_id)
+
+        r1 = match_issues_to_collection(str(series_dir), issue_objs, series_obj)
+        assert r1["1"]["found"] is False
+
+        with patch("helpers.collection.app_logger") as logger:
+            match_issues_to_collection(str(series_dir), issue_objs, series_obj)
+        messages = [c.args[0] for c in logger.debug.call_args_list]
+        assert any("Using cached collection status" in m for m in messages)
+
+
+class TestCollectionMatchingIndex:
+    """match_issues_to_collection only tests files whose names can contain the
+    issue number, but must still pick the same file a full scan would."""
+
+    def _objs(self, series_id):
+        from core.database import get_series_by_id, get_issues_for_series
+        from models.issue import IssueObj, SeriesObj
+        series = get_series_by_id(series_id)
+        issues = get_issues_for_series(series_id)
+        return [IssueObj(i) for i in issues], SeriesObj(series)
+
+    def test_pattern_match_picks_right_file(self, db_connection, tmp_path):
+        from core.database import set_user_preference
+        from helpers.collection import match_issues_to_collection
+
+        set_user_preference("custom_rename_pattern", "{series_name} {issue_number} ({volume_year})")
+        series_dir = tmp_path / "Spider-Man 2099 (1992)"
+        series_dir.mkdir()
+        series_id = create_series(
+            name="Spider-Man 2099", volume=1992, mapped_path=str(series_dir)
+        )
+        for n in ("2", "9", "44", "1.5"):
+            create_issue(series_id=series_id, number=n)
+        for n in (2, 9, 44):
+            (series_dir / f"Spider-Man 2099 {n:03d} (1992).cbz").write_bytes(b"stub")
+        (series_dir / "Spider-Man 2099 1.5 (1992).cbz").write_bytes(b"stub")
+
+        issue_objs, series_obj = self._objs(series_id)
+        result = match_issues_to_collection(str(series_dir), issue_objs, series_obj)
+
+        assert result["9"]["file_path"].endswith("Spider-Man 2099 009 (1992).cbz")
+        assert result["44"]["file_path"].endswith("Spider-Man 2099 044 (1992).cbz")
+        assert result["2"]["file_path"].endswith("Spider-Man 2099 002 (1992).cbz")
+        assert result["1.5"]["file_path"].endswith("Spider-Man 2099 1.5 (1992).cbz")
+
+    def test_dict_issues_match_like_objects(self, db_connection, tmp_path):
+        from core.database import get_series_by_id, get_issues_for_series
+        from helpers.collection import match_issues_to_collection
+
+        series_dir = tmp_path / "Saga (2012)"
+        series_dir.mkdir()
+        series_id = create_series(name="Saga", volume=2012, mapped_path=str(series_dir))
+        for n in ("1", "2"):
+            create_issue(series_id=series_id, number=n)
+        (series_dir / "Saga 001 (2012).cbz").write_bytes(b"stub")
+
+        issue_objs, series_obj = self._objs(series_id)
+        from_objs = match_issues_to_collection(
+            str(series_dir), issue_objs, series_obj, use_cache=False
+        )
+        from_dicts = match_issues_to_collection(
+            str(series_dir), get_issues_for_series(series_id),
+            get_series_by_id(series_id), use_cache=False,
+        )
+
+        assert from_dicts == from_objs
+        assert from_dicts["1"]["found"] is True
+        assert from_dicts["2"]["found"] is False
+
+    def test_directory_named_like_comic_is_ignored(self, db_connection, tmp_path):
+        from helpers.collection import match_issues_to_collection
+
+        series_dir = tmp_path / "Batman (2020)"
+        series_dir.mkdir()
+        series_id = create_series(name="Batman", volume=2020, mapped_path=str(series_dir))
+        create_issue(series_id=series_id, number="1")
+        create_issue(series_id=series_id, number="2")
+        (series_dir / "Batman 001 (2020).cbz").mkdir()
+        (series_dir / "Batman 002 (2020).cbz").write_bytes(b"stub")
+
+        issue_objs, series_obj = self._objs(series_id)
+        result = match_issues_to_collection(str(series_dir), issue_objs, series_obj)
+        assert result["1"]["found"] is False
+        assert result["2"]["file_path"] == str(series_dir / "Batman 002 (2020).cbz")
+
+    def test_deleted_file_invalidates_cache(self, db_connection, tmp_path):
+        from helpers.collection import match_issues_to_collection
+
+        series_dir = tmp_path / "Batman (2020)"
+        series_dir.mkdir()
+        series_id = create_series(name="Batman", volume=2020, mapped_path=str(series_dir))
+        create_issue(series_id=series_id, number="1")
+        comic = series_dir / "Batman 001 (2020).cbz"
+        comic.write_bytes(b"stub")
+
+        issue_objs, series_obj = self._objs(series_id)
+        assert match_issues_to_collection(str(series_dir), issue_objs, series_obj)["1"]["found"] is True
+
+        comic.unlink()
+        assert match_issues_to_collection(str(series_dir), issue_objs, series_obj)["1"]["found"] is False
+
+    def test_generic_fallback_uses_index(self, db_connection, tmp_path):
+        from helpers.collection import match_issues_to_collection
+
+        series_dir = tmp_path / "Odd Names"
+        series_dir.mkdir()
+        series_id = create_series(name="Odd Names", mapped_path=str(series_dir))
+        for n in ("5", "20", "7"):
+            create_issue(series_id=series_id, number=n)
+        (series_dir / "Something Else (2020) - 005.cbz").write_bytes(b"stub")
+        (series_dir / "Another #20.cbz").write_bytes(b"stub")
+        (series_dir / "Unrelated 17.cbz").write_bytes(b"stub")
+
+        issue_objs, series_obj = self._objs(series_id)
+        result = match_issues_to_collection(str(series_dir), issue_objs, series_obj)
+        assert result["5"]["file_path"].endswith("Something Else (2020) - 005.cbz")
+        assert result["20"]["file_path"].endswith("Another #20.cbz")
+        # "17" contains 7 as a digit suffix, but the fallback still requires a delimiter
+        assert result["7"]["found"] is False
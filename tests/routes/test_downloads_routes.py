@@ -3,6 +3,49 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 
+class TestJsonResponse:
+
+    def test_serializes_payload_with_status(self, app):
+        from routes.downloads import _json_response
+        with app.test_request_context():
+            resp = _json_response({"success": False, "error": "nope"}, 404)
+        assert resp.status_code == 404
+        assert resp.mimetype == "application/json"
+        assert resp.get_json() == {"success": False, "error": "nope"}
+
+    def test_falls_back_to_jsonify_without_orjson(self, app):
+        from routes.downloads import _json_response
+        with app.test_request_context(), patch("routes.downloads.orjson", None):
+            resp = _json_response({"success": True})
+        assert resp.status_code == 200
+        assert resp.get_json() == {"success": True}
+
+    def test_falls_back_for_types_orjson_rejects(self, app):
+        from decimal import Decimal
+        from routes.downloads import _json_response
+        with app.test_request_context():
+            resp = _json_response({"value": Decimal("1.5")})
+        assert resp.get_json() == {"value": "1.5"}
+
+
+class TestRequestJson:
+
+    def test_decodes_json_body(self, app):
+        from routes.downloads import _request_json
+        with app.test_request_context(json={"frequency": "daily", "weekday": 3}):
+            assert _request_json() == {"frequency": "daily", "weekday": 3}
+
+    def test_matches_get_json_without_orjson(self, app):
+        from routes.downloads import _request_json
+        with app.test_request_context(json={"a": 1}), patch("routes.downloads.orjson", None):
+            assert _request_json() == {"a": 1}
+
+    def test_malformed_body_is_bad_request(self, client):
+        resp = client.post("/api/getcomics/download", data="{not json",
+                           content_type="application/json")
+        assert resp.status_code == 400
+
+
 class TestGetcomicsSearch:
 
     @patch("models.getcomics.search_getcomics", return_value=[
@@ -145,6 +188,15 @@ class TestGetcomicsSchedule:
         data = resp.get_json()
         assert data["schedule"]["frequency"] == "disabled"
 
+    @patch("core.database.get_getcomics_schedule", return_value=None)
+    def test_get_default_is_stable_across_requests(self, mock_sched, client):
+        first = client.get("/api/get-getcomics-schedule")
+        second = client.get("/api/get-getcomics-schedule")
+        assert first is not second
+        assert first.get_json() == second.get_json()
+        assert second.get_json()["next_run"] == "Not scheduled"
+        assert second.mimetype == "application/json"
+
     @patch("core.database.save_getcomics_schedule", return_value=True)
     def test_save_schedule(self, mock_save, client):
         mock_app = MagicMock()
@@ -155,11 +207,46 @@ class TestGetcomicsSchedule:
         assert resp.status_code == 200
         assert resp.get_json()["success"] is True
 
-    def test_save_invalid_time(self, client):
+    @pytest.mark.parametrize("time_str", ["25:00", "12:60", "1200", "12:", "12:00\n", "", 1200])
+    def test_save_invalid_time(self, client, time_str):
         with patch.dict("sys.modules", {"app": MagicMock()}):
             resp = client.post("/api/save-getcomics-schedule",
-                               json={"frequency": "daily", "time": "25:00"})
+                               json={"frequency": "daily", "time": time_str})
+        assert resp.status_code == 400
+
+    @pytest.mark.parametrize("time_str", ["00:00", "9:30", "23:59", "12:5"])
+    @patch("core.database.save_getcomics_schedule", return_value=True)
+    def test_save_valid_time(self, mock_save, client, time_str):
+        with patch.dict("sys.modules", {"app": MagicMock()}):
+            resp = client.post("/api/save-getcomics-schedule",
+                               json={"frequency": "daily", "time": time_str})
+        assert resp.status_code == 200
+
+
+class TestSettingsBodyGuards:
+
+    ENDPOINTS = [
+        "/api/save-sync-schedule",
+        "/api/save-getcomics-schedule",
+        "/api/save-weekly-packs-config",
+    ]
+
+    @pytest.mark.parametrize("url", ENDPOINTS)
+    def test_oversized_body_rejected(self, client, url):
+        with patch.dict("sys.modules", {"app": MagicMock()}):
+            resp = client.post(url, data="x" * (16 * 1024 + 1),
+                               content_type="application/json")
+        assert resp.status_code == 413
+
+    @pytest.mark.parametrize("url", ENDPOINTS)
+    @pytest.mark.parametrize("body", ["", "{not json", "[]", "null"])
+    def test_missing_or_non_object_body_rejected(self, client, url, body):
+        with patch.dict("sys.modules", {"app": MagicMock()}), \
+                patch("core.database.save_getcomics_schedule") as save:
+            resp = client.post(url, data=body, content_type="application/json")
         assert resp.status_code == 400
+        assert resp.get_json()["error"] == "Invalid JSON body"
+        save.assert_not_called()
 
 
 class TestRunGetcomicsNow:
@@ -171,6 +258,70 @@ class TestRunGetcomicsNow:
         assert resp.status_code == 200
         assert resp.get_json()["success"] is True
 
+    def test_second_click_while_running_is_a_no_op(self, client):
+        import threading
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_download():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+
+        mock_app = MagicMock(scheduled_getcomics_download=slow_download)
+        with patch.dict("sys.modules", {"app": mock_app}):
+            first = client.post("/api/run-getcomics-now")
+            assert started.wait(5)
+            second = client.post("/api/run-getcomics-now")
+            release.set()
+
+        assert first.get_json()["message"] == "GetComics auto-download started in background"
+        assert second.get_json()["message"] == "GetComics auto-download is already running"
+        assert calls == [1]
+
+    def test_can_run_again_after_finishing(self):
+        import time
+        from routes.downloads import _submit_run_now
+        done = []
+        assert _submit_run_now("test-job", lambda: done.append(1))
+        for _ in range(100):
+            if _submit_run_now("test-job", lambda: done.append(2)):
+                break
+            time.sleep(0.01)
+        else:
+            pytest.fail("job never cleared its in-flight flag")
+
+    def test_running_scheduler_gets_a_one_shot_job(self):
+        from apscheduler.schedulers.base import STATE_RUNNING
+        from routes.downloads import _submit_run_now
+        done = []
+        scheduler = MagicMock(state=STATE_RUNNING)
+        with patch("core.app_state.scheduler", scheduler):
+            assert _submit_run_now("sched-job", lambda: done.append(1))
+            assert not _submit_run_now("sched-job", lambda: done.append(2))
+
+        scheduler.add_job.assert_called_once()
+        job, kwargs = scheduler.add_job.call_args.args[0], scheduler.add_job.call_args.kwargs
+        assert kwargs["trigger"] == "date"
+        assert kwargs["id"] == "manual-sched-job"
+        assert kwargs["max_instances"] == 1
+
+        job()
+        assert done == [1]
+        with patch("core.app_state.scheduler", scheduler):
+            assert _submit_run_now("sched-job", lambda: done.append(3))
+
+    def test_stopped_scheduler_falls_back_to_daemon_thread(self):
+        from apscheduler.schedulers.base import STATE_STOPPED
+        from routes.downloads import _submit_run_now
+        scheduler = MagicMock(state=STATE_STOPPED)
+        with patch("core.app_state.scheduler", scheduler), \
+                patch("routes.downloads.threading.Thread") as thread_cls:
+            assert _submit_run_now("thread-job", lambda: None)
+        scheduler.add_job.assert_not_called()
+        assert thread_cls.call_args.kwargs["daemon"] is True
+        thread_cls.return_value.start.assert_called_once()
+
 
 class TestWeeklyPacksConfig:
 
@@ -210,6 +361,52 @@ class TestWeeklyPacksConfig:
                 "publishers": ["FakePublisher"],
             })
         assert resp.status_code == 400
+        assert "['DC', 'Marvel', 'Image', 'INDIE']" in resp.get_json()["error"]
+
+    @pytest.mark.parametrize("publishers", [[["DC"]], [{}], "DC", {"DC": 1}])
+    def test_malformed_publishers(self, client, publishers):
+        with patch.dict("sys.modules", {"app": MagicMock()}):
+            resp = client.post("/api/save-weekly-packs-config", json={
+                "format": "JPG",
+                "publishers": publishers,
+            })
+        assert resp.status_code == 400
+
+    @patch("core.database.save_weekly_packs_config", return_value=True)
+    def test_start_date_within_range(self, mock_save, client):
+        from datetime import date, timedelta
+        start = (date.today() - timedelta(days=30)).isoformat()
+        with patch.dict("sys.modules", {"app": MagicMock()}):
+            resp = client.post("/api/save-weekly-packs-config", json={
+                "publishers": ["DC"], "start_date": start,
+            })
+        assert resp.status_code == 200
+        assert mock_save.call_args.args[-1] == start
+
+    @pytest.mark.parametrize("days_ago", [0, 180])
+    @patch("core.database.save_weekly_packs_config", return_value=True)
+    def test_start_date_window_is_inclusive(self, mock_save, client, days_ago):
+        from datetime import date, timedelta
+        start = (date.today() - timedelta(days=days_ago)).isoformat()
+        with patch.dict("sys.modules", {"app": MagicMock()}):
+            resp = client.post("/api/save-weekly-packs-config", json={
+                "publishers": ["DC"], "start_date": start,
+            })
+        assert resp.status_code == 200
+
+    @pytest.mark.parametrize("start_date,error", [
+        ("2020-01-01", "Start date must be within the last 6 months"),
+        ("2099-01-01", "Start date must be within the last 6 months"),
+        ("01/02/2024", "Invalid start_date format. Use YYYY-MM-DD"),
+        ("2024-02-30", "Invalid start_date format. Use YYYY-MM-DD"),
+    ])
+    def test_start_date_rejected(self, client, start_date, error):
+        with patch.dict("sys.modules", {"app": MagicMock()}):
+            resp = client.post("/api/save-weekly-packs-config", json={
+                "publishers": ["DC"], "start_date": start_date,
+            })
+        assert resp.status_code == 400
+        assert resp.get_json()["error"] == error
 
 
 class TestWeeklyPacksHistory:
@@ -223,6 +420,21 @@ class TestWeeklyPacksHistory:
         data = resp.get_json()
         assert data["success"] is True
         assert len(data["history"]) == 1
+        mock_hist.assert_called_once_with(20)
+
+    @pytest.mark.parametrize("query,expected", [
+        ("?limit=5", 5),
+        ("?limit=abc", 20),
+        ("?limit=", 20),
+        ("?limit=0", 1),
+        ("?limit=-3", 1),
+        ("?limit=100000", 200),
+    ])
+    @patch("core.database.get_weekly_packs_history", return_value=[])
+    def test_limit_parsing(self, mock_hist, client, query, expected):
+        resp = client.get(f"/api/weekly-packs-history{query}")
+        assert resp.status_code == 200
+        mock_hist.assert_called_once_with(expected)
 
 
 class TestRunWeeklyPacksNow:
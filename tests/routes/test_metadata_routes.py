@@ -10,6 +10,44 @@ from unittest.mock import patch, MagicMock, call
 
 class TestGenerateComicInfoXml:
 
+    ISSUE = {
+        "Title": "Fear & Loathing <Part 1>",
+        "Series": "Batman",
+        "Number": "001",
+        "Summary": "Line one\nLine two — \"quoted\" ’s",
+        "Writer": ["Tom King", "Scott Snyder"],
+        "Notes": "Tagged",
+    }
+
+    def test_lxml_and_elementtree_output_identical(self):
+        from routes import metadata
+
+        if metadata.LET is None:
+            pytest.skip("lxml not installed")
+        metadata._serialize_comicinfo.cache_clear()
+        with_lxml = metadata.generate_comicinfo_xml(self.ISSUE)
+        metadata._serialize_comicinfo.cache_clear()
+        with patch.object(metadata, "LET", None):
+            with_et = metadata.generate_comicinfo_xml(self.ISSUE)
+        assert with_lxml == with_et
+
+    def test_repeat_issue_served_from_cache(self):
+        from routes.metadata import generate_comicinfo_xml, _serialize_comicinfo
+
+        _serialize_comicinfo.cache_clear()
+        first = generate_comicinfo_xml(self.ISSUE)
+        again = generate_comicinfo_xml(dict(self.ISSUE))
+        other = generate_comicinfo_xml({**self.ISSUE, "Number": "2"})
+        assert again is first
+        assert b"<Number>2</Number>" in other
+        assert _serialize_comicinfo.cache_info().hits == 1
+
+    def test_control_characters_fall_back_to_elementtree(self):
+        from routes.metadata import generate_comicinfo_xml
+
+        xml_bytes = generate_comicinfo_xml({"Series": "Bad\x0bChar", "Notes": "n"})
+        assert b"<Series>Bad\x0bChar</Series>" in xml_bytes
+
     def test_generate_basic(self):
         """Test the generate_comicinfo_xml helper function."""
         from routes.metadata import generate_comicinfo_xml
@@ -118,6 +156,10 @@ class TestAsText:
         from routes.metadata import _as_text
         assert _as_text(42) == "42"
 
+    def test_list_skips_blank_and_stringifies_non_str(self):
+        from routes.metadata import _as_text
+        assert _as_text(("a", "  ", 3, "", None, " b ")) == "a, 3,  b "
+
 
 def _make_cbz(path, with_comicinfo=True):
     """Helper to create a minimal CBZ file for testing."""
@@ -259,6 +301,33 @@ class TestBulkClearComicInfo:
         assert data["success"] is True
         assert data["total"] == 2
 
+    @patch("core.database.set_has_comicinfo")
+    def test_bulk_clear_processes_every_file(self, mock_set, client, tmp_path):
+        import time
+        import core.app_state as app_state
+
+        cbz_dir = tmp_path / "data" / "many"
+        os.makedirs(str(cbz_dir), exist_ok=True)
+        paths = [str(cbz_dir / f"{n:02d}.cbz") for n in range(12)]
+        for path in paths:
+            _make_cbz(path, with_comicinfo=True)
+
+        resp = client.post('/cbz-bulk-clear-comicinfo',
+                           json={"paths": paths + paths[:3]})
+        data = resp.get_json()
+        assert data["total"] == 12
+
+        deadline = time.time() + 10
+        while app_state._operations[data["op_id"]]["status"] == "running":
+            assert time.time() < deadline, "bulk clear never completed"
+            time.sleep(0.02)
+
+        assert app_state._operations[data["op_id"]]["current"] == 12
+        for path in paths:
+            with zipfile.ZipFile(path) as zf:
+                assert "ComicInfo.xml" not in zf.namelist()
+        assert mock_set.call_count == 12
+
     def test_bulk_clear_empty(self, client, tmp_path):
         empty_dir = str(tmp_path / "data" / "empty")
         os.makedirs(empty_dir, exist_ok=True)
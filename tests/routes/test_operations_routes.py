@@ -5,6 +5,10 @@ import core.app_state as app_state
 def _clear_operations():
     with app_state._operations_lock:
         app_state._operations.clear()
+        app_state._op_clocks.clear()
+        app_state._running_ops.clear()
+        app_state._completed_ops.clear()
+        app_state._ops_snapshot = None
 
 
 class TestOperationsRoute:
@@ -247,3 +247,37 @@ class TestUpdateComicinfoInZip:
         assert "LanguageISO" not in result
         assert "Manga" not in result
         assert "Notes" not in result
+
+
+# ===== find_comicinfo_in_zip =====
+
+class TestFindComicinfoInZip:
+
+    def _zip(self, tmp_path, names):
+        import zipfile
+        path = tmp_path / "t.cbz"
+        with zipfile.ZipFile(path, "w") as zf:
+            for name in names:
+                zf.writestr(name, "<ComicInfo/>")
+        return zipfile.ZipFile(path, "r")
+
+    def test_canonical_name_skips_namelist(self, tmp_path):
+        from core.comicinfo import find_comicinfo_in_zip
+        with self._zip(tmp_path, ["page1.jpg", "ComicInfo.xml"]) as zf:
+            with patch.object(zf, "namelist", side_effect=AssertionError("scanned")):
+                assert find_comicinfo_in_zip(zf) == "ComicInfo.xml"
+
+    def test_case_insensitive_fallback(self, tmp_path):
+        from core.comicinfo import find_comicinfo_in_zip
+        with self._zip(tmp_path, ["page1.jpg", "comicinfo.XML"]) as zf:
+            assert find_comicinfo_in_zip(zf) == "comicinfo.XML"
+
+    def test_nested_fallback(self, tmp_path):
+        from core.comicinfo import find_comicinfo_in_zip
+        with self._zip(tmp_path, ["sub/ComicInfo.xml"]) as zf:
+            assert find_comicinfo_in_zip(zf) == "sub/ComicInfo.xml"
+
+    def test_missing(self, tmp_path):
+        from core.comicinfo import find_comicinfo_in_zip
+        with self._zip(tmp_path, ["page1.jpg"]) as zf:
+            assert find_comicinfo_in_zip(zf) is None
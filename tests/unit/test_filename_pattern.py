@@ -343,3 +343,124 @@ class TestAliasMatching:
             generate_filename_pattern(match_pattern, n, "11") for n in names
         ]
         assert any(r.match("Thor 011.cbz") for r in regexes)
+
+
+# ---- memoization ---------------------------------------------------------
+
+class TestPatternCaching:
+
+    def test_same_inputs_return_cached_regex(self):
+        a = generate_filename_pattern("{series_name} {issue_number}", "Sentry", "4")
+        b = generate_filename_pattern("{series_name} {issue_number}", "Sentry", "4")
+        assert a is b
+
+    def test_series_template_reused_across_issues(self):
+        from helpers.collection import _series_template, _compile_issue_pattern
+
+        template = _series_template("{series_name} {issue_number} ({volume_year})", "Black Cat")
+        regex = _compile_issue_pattern(template, "11")
+        assert regex.pattern == generate_filename_pattern(
+            "{series_name} {issue_number} ({volume_year})", "Black Cat", "11"
+        ).pattern
+        assert regex.search("Black Cat 011 (2024).cbz")
+        assert not _compile_issue_pattern(template, "12").search("Black Cat 011 (2024).cbz")
+
+
+# ---- separator backtracking ----------------------------------------------
+
+class TestSeparatorMatching:
+
+    def test_separator_still_optional(self):
+        regex = generate_filename_pattern(
+            "{series_name} {issue_number}", "Spider-Man 2099", "44",
+        )
+        assert regex.search("Spiderman 2099 044.cbz")
+        assert regex.search("Spider - Man 2099 044.cbz")
+
+    def test_optional_word_skipped(self):
+        regex = generate_filename_pattern(
+            "{series_name} {issue_number}", "Magik and Colossus", "1",
+        )
+        assert regex.search("Magik Colossus 001.cbz")
+        assert regex.search("Magik and Colossus 001.cbz")
+
+    def test_trailing_optional_word(self):
+        regex = generate_filename_pattern(
+            "{series_name} - {issue_number}", "Tom and", "1",
+        )
+        assert regex.search("Tom and - 001.cbz")
+        assert regex.search("Tom - 001.cbz")
+
+    def test_separator_is_possessive(self):
+        regex = generate_filename_pattern(
+            "{series_name} {issue_number}", "The Lord of the Rings", "1",
+        )
+        assert "*+" in regex.pattern
+        assert not regex.search("Lord " + "- " * 2000 + "Rings 002.cbz")
+
+    def test_series_and_issue_are_atomic(self):
+        regex = generate_filename_pattern(
+            "{series_name} {issue_number}", "Magik and Colossus", "10",
+        )
+        assert "(?>" in regex.pattern
+        assert regex.search("Magik and Colossus 0010.cbz")
+        assert not regex.search("Magik and Colossus 00100.cbz")
+
+    def test_issue_zero_with_leading_zeros(self):
+        regex = generate_filename_pattern("{series_name} {issue_number}", "Sentry", "0")
+        assert regex.search("Sentry 000.cbz")
+        assert not regex.search("Sentry 001.cbz")
+
+
+# ---- generic fallback patterns (match_issues_to_collection step 4c) -------
+
+class TestFallbackPatterns:
+
+    def _matches(self, check_num, filename):
+        from helpers.collection import _build_fallback_patterns
+        return any(p.search(filename) for p in _build_fallback_patterns(check_num))
+
+    def test_patterns_are_cached(self):
+        from helpers.collection import _build_fallback_patterns
+        assert _build_fallback_patterns("7") is _build_fallback_patterns("7")
+
+    def test_delimited_number(self):
+        assert self._matches("7", "Some Book 007 (2020).cbz")
+        assert self._matches("7", "Some Book_7.cbz")
+
+    def test_hash_number(self):
+        assert self._matches("7", "Some Book #07.cbz")
+
+    def test_rejects_longer_number(self):
+        assert not self._matches("7", "Some Book 070.cbz")
+        assert not self._matches("7", "Some Book #70.cbz")
+
+
+class TestExtractIssueNumbers:
+
+    def test_every_digit_run_suffix(self):
+        from helpers.collection import _extract_issue_numbers_from_filename
+        nums = _extract_issue_numbers_from_filename("Spider-Man 2099 044 (1992).cbz")
+        assert {"2099", "99", "9", "44", "4", "1992", "992", "92", "2"} <= nums
+
+    def test_zero_padded_zero(self):
+        from helpers.collection import _extract_issue_numbers_from_filename
+        assert "0" in _extract_issue_numbers_from_filename("Sentry 000.cbz")
+
+    def test_no_digits(self):
+        from helpers.collection import _extract_issue_numbers_from_filename
+        assert _extract_issue_numbers_from_filename("Sentry.cbz") == set()
+
+
+class TestSeriesTemplateCaching:
+
+    def test_template_memoized(self):
+        from helpers.collection import _series_template
+        _series_template.cache_clear()
+        _series_template("{series_name} {issue_number}", "Hawkeye")
+        _series_template("{series_name} {issue_number}", "Hawkeye")
+        assert _series_template.cache_info().hits == 1
+
+    def test_issue_fragment_normalizes_leading_zeros(self):
+        from helpers.collection import _issue_number_pattern
+        assert _issue_number_pattern("007") == _issue_number_pattern("7")
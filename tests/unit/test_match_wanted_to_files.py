@@ -250,3 +250,86 @@ class TestExtractComicInfoCached:
         cache = {}
         assert extract_comicinfo_cached(f, cache) == {}
         assert cache[f] == {}
+
+
+class TestPrefetchComicInfo:
+
+    def test_fills_cache_for_all_archives(self, tmp_path):
+        from helpers.collection import prefetch_comicinfo
+
+        paths = []
+        for i in range(1, 6):
+            f = str(tmp_path / f"{i}.cbz")
+            _make_cbz_with_comicinfo(f, series="Saga", number=str(i))
+            paths.append(f)
+        cbr = str(tmp_path / "x.cbr")
+        cache = {}
+        prefetch_comicinfo(paths + [cbr], cache)
+        assert [cache[p]["number"] for p in paths] == ["1", "2", "3", "4", "5"]
+        assert cbr not in cache  # non-archives resolve lazily without a read
+
+    def test_skips_already_cached(self, tmp_path, monkeypatch):
+        import helpers.collection as collection
+
+        a = str(tmp_path / "a.cbz")
+        b = str(tmp_path / "b.cbz")
+        c = str(tmp_path / "c.cbz")
+        for f in (a, b, c):
+            _make_cbz_with_comicinfo(f, series="Saga", number="1")
+        seen = []
+        real = collection.extract_comicinfo
+
+        def recording(path):
+            seen.append(path)
+            return real(path)
+
+        monkeypatch.setattr(collection, "extract_comicinfo", recording)
+        cache = {a: {"number": "9"}}
+        collection.prefetch_comicinfo([a, b, c], cache)
+        assert sorted(seen) == [b, c]
+        assert cache[a] == {"number": "9"}
+
+
+class TestExtractComicInfo:
+
+    def _write(self, path, xml):
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("ComicInfo.xml", xml)
+
+    def test_reads_top_level_fields(self, tmp_path):
+        from helpers.collection import extract_comicinfo
+
+        f = str(tmp_path / "x.cbz")
+        self._write(f, (
+            "<ComicInfo><Title>T</Title><Series>Saga</Series><Number>3</Number>"
+            "<Volume>2012</Volume><Year>2012</Year><Summary>long</Summary></ComicInfo>"
+        ))
+        assert extract_comicinfo(f) == {
+            "series": "Saga", "number": "3", "volume": "2012", "year": "2012",
+        }
+
+    def test_missing_and_empty_fields_are_blank(self, tmp_path):
+        from helpers.collection import extract_comicinfo
+
+        f = str(tmp_path / "x.cbz")
+        self._write(f, "<ComicInfo><Series>Saga</Series><Number/></ComicInfo>")
+        assert extract_comicinfo(f) == {
+            "series": "Saga", "number": "", "volume": "", "year": "",
+        }
+
+    def test_nested_elements_ignored(self, tmp_path):
+        from helpers.collection import extract_comicinfo
+
+        f = str(tmp_path / "x.cbz")
+        self._write(f, (
+            "<ComicInfo><Pages><Number>9</Number></Pages>"
+            "<Number>3</Number></ComicInfo>"
+        ))
+        assert extract_comicinfo(f)["number"] == "3"
+
+    def test_malformed_xml_returns_none(self, tmp_path):
+        from helpers.collection import extract_comicinfo
+
+        f = str(tmp_path / "x.cbz")
+        self._write(f, "<ComicInfo><Series>Saga")
+        assert extract_comicinfo(f) is None
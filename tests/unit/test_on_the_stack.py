@@ -1,16 +1,42 @@
 """Tests for get_on_the_stack_items() and subscription functions in database.py."""
-import pytest
-from unittest.mock import patch
-
+from collections import defaultdict
 
-@pytest.fixture
-def stack_db(db_connection):
-    """Set up a database with series, issues, and collection_status for On the Stack tests."""
-    from tests.factories.db_factories import (
-        create_publisher, create_series, create_issue, reset_counters,
-    )
-    from core.database import save_collection_status_bulk, mark_issue_read
+import pytest
 
+import core.database as database
+from core.database import (
+    get_on_the_stack_items,
+    get_series_subscription,
+    mark_issues_read_bulk,
+    save_collection_status_bulk_tuples,
+    set_series_subscription,
+)
+from tests.factories.db_factories import (
+    create_publisher, create_series, create_issue, reset_counters, restore_db,
+    use_test_db,
+)
+
+# (series_id, name, issue count) for every seeded series; issue ids are
+# series_id * 10 + number.
+_STACK_SERIES = (
+    (100, "Absolute Batman", 5),
+    (200, "Superman", 3),
+    (300, "Dark Crisis", 2),
+    (400, "Wonder Woman", 2),
+)
+_ISSUE_PATH = "/data/DC/%s/%s %03d.cbz"
+
+
+def by_series(items):
+    """Group On the Stack items by series name."""
+    grouped = defaultdict(list)
+    for item in items:
+        grouped[item["series_name"]].append(item)
+    return grouped
+
+
+def _seed_stack_db():
+    """Series, issues, collection_status and read marks for On the Stack tests."""
     reset_counters()
     pub_id = create_publisher(publisher_id=10, name="DC Comics")
 
@@ -22,18 +48,6 @@ def stack_db(db_connection):
         create_issue(issue_id=1000 + i, series_id=100, number=str(i),
                      cover_date=f"2024-{i:02d}-15", store_date=f"2024-{i:02d}-10",
                      image=f"https://example.com/ab{i}.jpg")
-    save_collection_status_bulk([
-        {"series_id": 100, "issue_id": 1000 + i, "issue_number": str(i),
-         "found": 1, "file_path": f"/data/DC/Absolute Batman/Absolute Batman {i:03d}.cbz",
-         "file_mtime": 1700000000.0 + i, "matched_via": "exact"}
-        for i in range(1, 6)
-    ])
-    mark_issue_read(issue_path="/data/DC/Absolute Batman/Absolute Batman 001.cbz",
-                    read_at="2024-11-01 10:00:00", page_count=24, time_spent=600)
-    mark_issue_read(issue_path="/data/DC/Absolute Batman/Absolute Batman 002.cbz",
-                    read_at="2024-11-15 10:00:00", page_count=24, time_spent=600)
-    mark_issue_read(issue_path="/data/DC/Absolute Batman/Absolute Batman 003.cbz",
-                    read_at="2024-12-01 10:00:00", page_count=24, time_spent=600)
 
     # Series B: Ongoing, issues 1-3, read 1, unread 2-3
     create_series(series_id=200, name="Superman", volume=2024,
@@ -42,14 +56,6 @@ def stack_db(db_connection):
     for i in range(1, 4):
         create_issue(issue_id=2000 + i, series_id=200, number=str(i),
                      cover_date=f"2024-{i:02d}-15", store_date=f"2024-{i:02d}-10")
-    save_collection_status_bulk([
-        {"series_id": 200, "issue_id": 2000 + i, "issue_number": str(i),
-         "found": 1, "file_path": f"/data/DC/Superman/Superman {i:03d}.cbz",
-         "file_mtime": 1700000000.0 + i, "matched_via": "exact"}
-        for i in range(1, 4)
-    ])
-    mark_issue_read(issue_path="/data/DC/Superman/Superman 001.cbz",
-                    read_at="2024-10-01 10:00:00", page_count=24, time_spent=600)
 
     # Series C: Ended, issues 1-2, read 1, unread 2
     create_series(series_id=300, name="Dark Crisis", volume=2022,
@@ -58,14 +64,6 @@ def stack_db(db_connection):
     for i in range(1, 3):
         create_issue(issue_id=3000 + i, series_id=300, number=str(i),
                      cover_date=f"2022-{i:02d}-15", store_date=f"2022-{i:02d}-10")
-    save_collection_status_bulk([
-        {"series_id": 300, "issue_id": 3000 + i, "issue_number": str(i),
-         "found": 1, "file_path": f"/data/DC/Dark Crisis/Dark Crisis {i:03d}.cbz",
-         "file_mtime": 1700000000.0 + i, "matched_via": "exact"}
-        for i in range(1, 3)
-    ])
-    mark_issue_read(issue_path="/data/DC/Dark Crisis/Dark Crisis 001.cbz",
-                    read_at="2024-09-01 10:00:00", page_count=24, time_spent=600)
 
     # Series D: Ongoing, no issues read
     create_series(series_id=400, name="Wonder Woman", volume=2024,
@@ -74,91 +72,124 @@ def stack_db(db_connection):
     for i in range(1, 3):
         create_issue(issue_id=4000 + i, series_id=400, number=str(i),
                      cover_date=f"2024-{i:02d}-15", store_date=f"2024-{i:02d}-10")
-    save_collection_status_bulk([
-        {"series_id": 400, "issue_id": 4000 + i, "issue_number": str(i),
-         "found": 1, "file_path": f"/data/DC/Wonder Woman/Wonder Woman {i:03d}.cbz",
-         "file_mtime": 1700000000.0 + i, "matched_via": "exact"}
-        for i in range(1, 3)
+
+    save_collection_status_bulk_tuples(
+        (series_id, series_id * 10 + i, str(i), 1,
+         _ISSUE_PATH % (name, name, i), 1700000000.0 + i, "exact")
+        for series_id, name, count in _STACK_SERIES
+        for i in range(1, count + 1)
+    )
+    mark_issues_read_bulk([
+        {"issue_path": path, "read_at": read_at, "page_count": 24, "time_spent": 600}
+        for path, read_at in [
+            (_ISSUE_PATH % ("Absolute Batman", "Absolute Batman", 1), "2024-11-01 10:00:00"),
+            (_ISSUE_PATH % ("Absolute Batman", "Absolute Batman", 2), "2024-11-15 10:00:00"),
+            (_ISSUE_PATH % ("Absolute Batman", "Absolute Batman", 3), "2024-12-01 10:00:00"),
+            (_ISSUE_PATH % ("Superman", "Superman", 1), "2024-10-01 10:00:00"),
+            (_ISSUE_PATH % ("Dark Crisis", "Dark Crisis", 1), "2024-09-01 10:00:00"),
+        ]
     ])
 
-    return db_connection
+
+@pytest.fixture(scope="session")
+def stack_template(db_template, tmp_path_factory):
+    """Seeded copy of the schema template, built once per session."""
+    path = str(tmp_path_factory.mktemp("stack_template") / "stack.db")
+    restore_db(db_template, path)
+    with use_test_db(path):
+        _seed_stack_db()
+    return path
+
+
+@pytest.fixture(scope="class")
+def stack_db(stack_template, tmp_path_factory):
+    """Copy of the seeded database shared by a test class."""
+    path = str(tmp_path_factory.mktemp("stack_db") / "stack.db")
+    restore_db(stack_template, path)
+    with use_test_db(path):
+        conn = database.get_db_connection()
+        yield conn
+        conn.close()
+
+
+@pytest.fixture(autouse=True)
+def _restore_stack_db(request):
+    """Put the class's database back after any stack_db test not marked readonly."""
+    if "stack_db" not in request.fixturenames or request.node.get_closest_marker("readonly"):
+        yield
+        return
+    template = request.getfixturevalue("stack_template")
+    request.getfixturevalue("stack_db")
+    yield
+    restore_db(template, database.get_db_path())
 
 
 class TestGetOnTheStackItems:
 
+    @pytest.mark.readonly
     def test_returns_next_unread_issue(self, stack_db):
         """Series with issues 1-3 read, issue 4 unread -> returns issue 4."""
-        from core.database import get_on_the_stack_items
         items = get_on_the_stack_items(limit=10)
-        ab_items = [i for i in items if i["series_name"] == "Absolute Batman"]
+        ab_items = by_series(items).get("Absolute Batman", [])
         assert len(ab_items) == 1
         assert ab_items[0]["issue_number"] == "4"
         assert "Absolute Batman 004.cbz" in ab_items[0]["file_path"]
 
+    @pytest.mark.readonly
     def test_skips_series_without_reads(self, stack_db):
         """Series with no read issues -> not included."""
-        from core.database import get_on_the_stack_items
         items = get_on_the_stack_items(limit=10)
-        ww_items = [i for i in items if i["series_name"] == "Wonder Woman"]
+        ww_items = by_series(items).get("Wonder Woman", [])
         assert len(ww_items) == 0
 
-    def test_respects_subscription_disabled(self, stack_db):
-        """Series with subscription=0 -> not included."""
-        from core.database import get_on_the_stack_items, set_series_subscription
-        set_series_subscription(100, False)
-        items = get_on_the_stack_items(limit=10)
-        ab_items = [i for i in items if i["series_name"] == "Absolute Batman"]
-        assert len(ab_items) == 0
-
-    def test_null_subscription_ongoing_included(self, stack_db):
-        """Series with subscription=NULL and status=Ongoing -> included."""
-        from core.database import get_on_the_stack_items
-        items = get_on_the_stack_items(limit=10)
-        series_names = [i["series_name"] for i in items]
-        assert "Absolute Batman" in series_names
-        assert "Superman" in series_names
-
-    def test_null_subscription_ended_excluded(self, stack_db):
-        """Series with subscription=NULL and status=Ended -> excluded."""
-        from core.database import get_on_the_stack_items
-        items = get_on_the_stack_items(limit=10)
-        dc_items = [i for i in items if i["series_name"] == "Dark Crisis"]
-        assert len(dc_items) == 0
-
+    @pytest.mark.parametrize("series_id,override,expected_issue", [
+        pytest.param(100, None, "4", marks=pytest.mark.readonly),   # NULL, Ongoing -> included
+        pytest.param(200, None, "2", marks=pytest.mark.readonly),
+        pytest.param(300, None, None, marks=pytest.mark.readonly),  # NULL, Ended -> excluded
+        (100, False, None),  # subscription=0 -> excluded
+        (300, True, "2"),    # Ended but subscription=1 -> included
+        pytest.param(99999, None, None, marks=pytest.mark.readonly),
+    ])
+    def test_subscription_matrix(self, stack_db, series_id, override, expected_issue):
+        """Subscription overrides and series status decide who is on the stack."""
+        if override is not None:
+            set_series_subscription(series_id, override)
+        items = {i["series_id"]: i for i in get_on_the_stack_items(limit=10)}
+        if expected_issue is None:
+            assert series_id not in items
+        else:
+            assert items[series_id]["issue_number"] == expected_issue
+
+    @pytest.mark.readonly
     def test_shows_lowest_unread_after_read(self, stack_db):
         """Read 1,2,3 -- unread 4,5 -> returns only 4."""
-        from core.database import get_on_the_stack_items
         items = get_on_the_stack_items(limit=10)
-        ab_items = [i for i in items if i["series_name"] == "Absolute Batman"]
+        ab_items = by_series(items).get("Absolute Batman", [])
         assert len(ab_items) == 1
         assert ab_items[0]["issue_number"] == "4"
 
+    @pytest.mark.readonly
     def test_sorted_by_last_read_date(self, stack_db):
         """Multiple series -> sorted by most recently read first."""
-        from core.database import get_on_the_stack_items
         items = get_on_the_stack_items(limit=10)
         # Absolute Batman last read 2024-12-01, Superman last read 2024-10-01
         assert items[0]["series_name"] == "Absolute Batman"
         assert items[1]["series_name"] == "Superman"
 
+    @pytest.mark.readonly
     def test_limit_parameter(self, stack_db):
         """Respects the limit parameter."""
-        from core.database import get_on_the_stack_items
         items = get_on_the_stack_items(limit=1)
         assert len(items) == 1
 
-    def test_ended_series_with_explicit_subscription(self, stack_db):
-        """Ended series with subscription=1 -> included."""
-        from core.database import get_on_the_stack_items, set_series_subscription
-        set_series_subscription(300, True)
-        items = get_on_the_stack_items(limit=10)
-        dc_items = [i for i in items if i["series_name"] == "Dark Crisis"]
-        assert len(dc_items) == 1
-        assert dc_items[0]["issue_number"] == "2"
+    @pytest.mark.readonly
+    def test_negative_limit_returns_nothing(self, stack_db):
+        """A negative limit is clamped to zero rather than meaning 'no limit'."""
+        assert get_on_the_stack_items(limit=-1) == []
 
+    @pytest.mark.readonly
     def test_return_format(self, stack_db):
         """Verify returned dict has all expected keys."""
-        from core.database import get_on_the_stack_items
         items = get_on_the_stack_items(limit=10)
         assert len(items) > 0
         item = items[0]
@@ -174,31 +205,14 @@ class TestGetOnTheStackItems:
 
 class TestSeriesSubscription:
 
-    def test_set_and_get_subscription_enabled(self, stack_db):
-        """Setting subscription to True returns True."""
-        from core.database import set_series_subscription, get_series_subscription
-        set_series_subscription(100, True)
-        assert get_series_subscription(100) is True
-
-    def test_set_and_get_subscription_disabled(self, stack_db):
-        """Setting subscription to False returns False."""
-        from core.database import set_series_subscription, get_series_subscription
-        set_series_subscription(100, False)
-        assert get_series_subscription(100) is False
-
-    def test_null_subscription_ongoing_defaults_true(self, stack_db):
-        """NULL subscription on Ongoing series defaults to True."""
-        from core.database import get_series_subscription
-        # Series 100 is Ongoing with NULL subscription
-        assert get_series_subscription(100) is True
-
-    def test_null_subscription_ended_defaults_false(self, stack_db):
-        """NULL subscription on Ended series defaults to False."""
-        from core.database import get_series_subscription
-        # Series 300 is Ended with NULL subscription
-        assert get_series_subscription(300) is False
-
-    def test_nonexistent_series_returns_false(self, stack_db):
-        """Nonexistent series returns False."""
-        from core.database import get_series_subscription
-        assert get_series_subscription(99999) is False
+    @pytest.mark.parametrize("series_id,override,expected", [
+        (100, True, True),
+        (100, False, False),
+        pytest.param(100, None, True, marks=pytest.mark.readonly),     # NULL on Ongoing -> True
+        pytest.param(300, None, False, marks=pytest.mark.readonly),    # NULL on Ended -> False
+        pytest.param(99999, None, False, marks=pytest.mark.readonly),  # nonexistent series
+    ])
+    def test_get_subscription(self, stack_db, series_id, override, expected):
+        if override is not None:
+            set_series_subscription(series_id, override)
+        assert get_series_subscription(series_id) is expected
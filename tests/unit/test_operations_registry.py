@@ -1,17 +1,7 @@
 """Unit tests for the operations registry in app_state.py."""
-import sys
-import types
 import time
 import threading
-from unittest.mock import patch, MagicMock
-
-# Ensure apscheduler is importable before app_state
-if "apscheduler" not in sys.modules:
-    sys.modules["apscheduler"] = types.ModuleType("apscheduler")
-    sys.modules["apscheduler.schedulers"] = types.ModuleType("apscheduler.schedulers")
-    _bg = types.ModuleType("apscheduler.schedulers.background")
-    _bg.BackgroundScheduler = MagicMock
-    sys.modules["apscheduler.schedulers.background"] = _bg
+from unittest.mock import patch
 
 import core.app_state as app_state
 
@@ -20,6 +10,10 @@ def _clear_operations():
     """Helper to reset the registry between tests."""
     with app_state._operations_lock:
         app_state._operations.clear()
+        app_state._op_clocks.clear()
+        app_state._running_ops.clear()
+        app_state._completed_ops.clear()
+        app_state._ops_snapshot = None
 
 
 class TestRegisterOperation:
@@ -45,11 +39,26 @@ class TestRegisterOperation:
         assert op["started_at"] > 0
         assert op["completed_at"] is None
 
+    def test_timestamps_are_epoch_seconds(self):
+        before = time.time()
+        op_id = app_state.register_operation("move", "file.cbz", total=1)
+        app_state.update_operation(op_id, current=1)
+        app_state.complete_operation(op_id)
+        op = app_state.get_operation(op_id)
+        for field in ("started_at", "updated_at", "completed_at"):
+            assert isinstance(op[field], float)
+            assert before <= op[field] <= time.time()
+
+    def test_wall_clock_jump_does_not_expire(self):
+        op_id = app_state.register_operation("move", "file.cbz", total=1)
+        app_state.complete_operation(op_id)
+        with patch("core.app_state.time.time", return_value=time.time() + 86400):
+            assert app_state.get_operation(op_id) is not None
+
     def test_update_operation(self):
         op_id = app_state.register_operation("move", "file.cbz", total=100)
         app_state.update_operation(op_id, current=50, detail="Copying...")
-        ops = app_state.get_active_operations()
-        op = ops[0]
+        op = app_state.get_operation(op_id)
         assert op["current"] == 50
         assert op["detail"] == "Copying..."
 
@@ -57,8 +66,7 @@ class TestRegisterOperation:
         op_id = app_state.register_operation("convert", "folder", total=5)
         app_state.update_operation(op_id, current=3)
         app_state.complete_operation(op_id)
-        ops = app_state.get_active_operations()
-        op = ops[0]
+        op = app_state.get_operation(op_id)
         assert op["status"] == "completed"
         assert op["current"] == 5  # snapped to total
         assert op["completed_at"] is not None
@@ -66,8 +74,7 @@ class TestRegisterOperation:
     def test_complete_with_error(self):
         op_id = app_state.register_operation("metadata", "X-Men", total=10)
         app_state.complete_operation(op_id, error=True)
-        ops = app_state.get_active_operations()
-        op = ops[0]
+        op = app_state.get_operation(op_id)
         assert op["status"] == "error"
         assert op["completed_at"] is not None
         # current should NOT snap to total on error
@@ -78,22 +85,78 @@ class TestRegisterOperation:
         app_state.complete_operation(op_id)
         # Backdate completed_at to force expiry
         with app_state._operations_lock:
-            app_state._operations[op_id]["completed_at"] = time.time() - app_state.COMPLETED_TTL - 1
+            app_state._op_clocks[op_id][1] = time.monotonic_ns() - app_state.COMPLETED_TTL_NS - 1
         ops = app_state.get_active_operations()
         assert len(ops) == 0
 
+    def test_cleanup_keeps_unexpired_in_completion_order(self):
+        old_id = app_state.register_operation("move", "old-op", total=1)
+        new_id = app_state.register_operation("move", "new-op", total=1)
+        running_id = app_state.register_operation("move", "running-op", total=1)
+        app_state.complete_operation(old_id)
+        app_state.complete_operation(new_id)
+        with app_state._operations_lock:
+            app_state._op_clocks[old_id][1] = time.monotonic_ns() - app_state.COMPLETED_TTL_NS - 1
+        ids = {op["id"] for op in app_state.get_active_operations()}
+        assert ids == {new_id, running_id}
+        assert list(app_state._completed_ops) == [new_id]
+
     def test_stale_running_op_marked_error(self):
         op_id = app_state.register_operation("metadata", "stale-op", total=5)
         app_state.update_operation(op_id, current=2, detail="file2.cbz")
         # Backdate updated_at to exceed STALE_TIMEOUT
         with app_state._operations_lock:
-            app_state._operations[op_id]["updated_at"] = time.time() - app_state.STALE_TIMEOUT - 1
+            app_state._op_clocks[op_id][0] = time.monotonic_ns() - app_state.STALE_TIMEOUT_NS - 1
         ops = app_state.get_active_operations()
         op = ops[0]
         assert op["status"] == "error"
         assert op["detail"] == "Operation stalled"
         assert op["completed_at"] is not None
 
+    def test_get_operation_marks_stale(self):
+        op_id = app_state.register_operation("metadata", "stale-op", total=5)
+        with app_state._operations_lock:
+            app_state._op_clocks[op_id][0] = time.monotonic_ns() - app_state.STALE_TIMEOUT_NS - 1
+        op = app_state.get_operation(op_id)
+        assert op["status"] == "error"
+        assert op["detail"] == "Operation stalled"
+        assert list(app_state._completed_ops) == [op_id]
+
+    def test_get_operation_expired_or_unknown(self):
+        op_id = app_state.register_operation("move", "old-op", total=1)
+        app_state.complete_operation(op_id)
+        with app_state._operations_lock:
+            app_state._op_clocks[op_id][1] = time.monotonic_ns() - app_state.COMPLETED_TTL_NS - 1
+        assert app_state.get_operation(op_id) is None
+        assert app_state.get_operation("nonexistent-id") is None
+        assert app_state.get_active_operations() == []
+
+    def test_returns_snapshots(self):
+        op_id = app_state.register_operation("move", "file.cbz", total=10)
+        snapshot = app_state.get_active_operations()[0]
+        app_state.update_operation(op_id, current=5)
+        snapshot["detail"] = "mutated by caller"
+        assert snapshot["current"] == 0
+        op = app_state.get_active_operations()[0]
+        assert op["current"] == 5
+        assert op["detail"] == "Starting..."
+
+    def test_snapshot_reused_until_registry_changes(self):
+        op_id = app_state.register_operation("move", "file.cbz", total=10)
+        first = app_state.get_active_operations()
+        assert app_state.get_active_operations()[0] is first[0]
+        app_state.update_operation(op_id, current=5)
+        second = app_state.get_active_operations()
+        assert second[0] is not first[0]
+        assert second[0]["current"] == 5
+
+    def test_snapshot_lapses_when_op_goes_stale(self):
+        app_state.register_operation("metadata", "stale-op", total=5)
+        assert app_state.get_active_operations()[0]["status"] == "running"
+        with patch("core.app_state.time.monotonic_ns",
+                   return_value=time.monotonic_ns() + app_state.STALE_TIMEOUT_NS + 1):
+            assert app_state.get_active_operations()[0]["status"] == "error"
+
     def test_update_nonexistent_op(self):
         # Should not raise
         app_state.update_operation("nonexistent-id", current=5, detail="test")
@@ -120,4 +183,30 @@ class TestRegisterOperation:
         ops = app_state.get_active_operations()
         assert len(ops) == 200
         # All IDs should be unique
-        assert len(set(results)) == 200
+        assert len(dict.fromkeys(results)) == len(results) == 200
+
+    def test_bulk_thread_safety(self):
+        results = []
+
+        def register_batch(n):
+            results.extend(app_state.register_operations_bulk(
+                [("metadata", f"test {i}", i) for i in range(n)]
+            ))
+
+        threads = [threading.Thread(target=register_batch, args=(50,)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        ops = app_state.get_active_operations()
+        assert len(ops) == 200
+        assert len(dict.fromkeys(results)) == len(results) == 200
+        assert all(op["status"] == "running" for op in ops)
+
+    def test_bulk_preserves_order(self):
+        ids = app_state.register_operations_bulk([("metadata", "a", 1), ("convert", "b", 2)])
+        ops = {op["id"]: op for op in app_state.get_active_operations()}
+        assert [ops[i]["label"] for i in ids] == ["a", "b"]
+        assert ops[ids[1]]["op_type"] == "convert"
+        assert ops[ids[1]]["total"] == 2
@@ -116,3 +116,78 @@ def test_calls_match_parent_permissions_on_success(tmp_path, monkeypatch):
         zf.writestr("001.jpg", b"x")
 
     assert called == [str(dest)]
+
+
+def _members(path):
+    with zipfile.ZipFile(str(path)) as zf:
+        return [(i.filename, i.compress_type, zf.read(i.filename)) for i in zf.infolist()]
+
+
+def test_copy_member_raw_preserves_entries(tmp_path, local_staging):
+    src = tmp_path / "src.cbz"
+    with zipfile.ZipFile(str(src), "w") as zf:
+        zf.writestr("001.jpg", os.urandom(2048), compress_type=zipfile.ZIP_STORED)
+        zf.writestr("002.jpg", b"page" * 5000, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("ComicInfo.xml", b"<ComicInfo/>")
+
+    dest = tmp_path / "out.cbz"
+    with zipfile.ZipFile(str(src)) as old, helpers.open_zip_for_write(str(dest)) as new:
+        for info in old.infolist():
+            if info.filename != "ComicInfo.xml":
+                helpers.copy_zip_member_raw(old, new, info)
+
+    assert _members(dest) == [m for m in _members(src) if m[0] != "ComicInfo.xml"]
+    with zipfile.ZipFile(str(dest)) as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("002.jpg").compress_size < 20000
+
+
+def test_copy_member_raw_drops_data_descriptor(tmp_path, local_staging):
+    """Members streamed with a data descriptor (bit 3) must get real sizes
+    in their new local header, since no descriptor follows the copy."""
+    src = tmp_path / "streamed.cbz"
+    with open(src, "wb") as raw:
+        # A non-seekable writer forces zipfile to emit data descriptors.
+        class _Unseekable:
+            def write(self, b):
+                return raw.write(b)
+
+            def flush(self):
+                raw.flush()
+
+        with zipfile.ZipFile(_Unseekable(), "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("001.jpg", b"streamed" * 100)
+
+    dest = tmp_path / "out.cbz"
+    with zipfile.ZipFile(str(src)) as old, helpers.open_zip_for_write(str(dest)) as new:
+        assert old.infolist()[0].flag_bits & 0x08
+        helpers.copy_zip_member_raw(old, new, old.infolist()[0])
+
+    with zipfile.ZipFile(str(dest)) as zf:
+        info = zf.infolist()[0]
+        assert not info.flag_bits & 0x08
+        assert zf.read("001.jpg") == b"streamed" * 100
+
+
+def test_copy_member_raw_supported_on_this_interpreter():
+    """The raw path must resolve on every supported Python (3.13 moved the
+    extra-field stripper to zipfile._Extra.strip)."""
+    assert helpers._zip_strip_extra() is not None
+
+
+def test_copy_member_raw_falls_back_without_private_api(tmp_path, local_staging, monkeypatch):
+    """With zipfile's private extra-field helpers gone the member is
+    recompressed instead of failing."""
+    src = tmp_path / "src.cbz"
+    with zipfile.ZipFile(str(src), "w") as zf:
+        zf.writestr("001.jpg", b"page" * 5000, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("002.jpg", os.urandom(512), compress_type=zipfile.ZIP_STORED)
+    monkeypatch.delattr(zipfile, "_strip_extra", raising=False)
+    monkeypatch.delattr(zipfile, "_Extra", raising=False)
+
+    dest = tmp_path / "out.cbz"
+    with zipfile.ZipFile(str(src)) as old, helpers.open_zip_for_write(str(dest)) as new:
+        for info in old.infolist():
+            helpers.copy_zip_member_raw(old, new, info)
+
+    assert _members(dest) == _members(src)